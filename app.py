@@ -119,7 +119,8 @@ class ESP32ManagerApp:
                 name=args.name,
                 description=getattr(args, 'description', ''),
                 template=getattr(args, 'template', 'basic'),
-                author=getattr(args, 'author', '')
+                author=getattr(args, 'author', ''),
+                disabled_features=getattr(args, 'without', None)
             )
 
             print(f"✅ Created project '{project.name}' at {project.path}")
@@ -304,7 +305,8 @@ class ESP32ManagerApp:
 
             print(f"🔨 Building project '{project_name}' with '{config_name}' configuration...")
 
-            result = self.build_manager.build_project(project, config_name)
+            overrides = {'cross_compile': True} if getattr(args, 'precompile', False) else {}
+            result = self.build_manager.build_project(project, config_name, **overrides)
 
             if result.success:
                 print(f"✅ Build completed successfully!")
@@ -346,9 +348,12 @@ class ESP32ManagerApp:
 
             # Check if project is built
             build_dir = self.build_manager.build_system.build_dir / project_name
-            if not build_dir.exists():
-                print("⚠️  Project not built. Building now...")
-                build_result = self.build_manager.build_project(project, 'production')
+            precompile = getattr(args, 'precompile', False)
+            if precompile or not build_dir.exists():
+                if not precompile:
+                    print("⚠️  Project not built. Building now...")
+                overrides = {'cross_compile': True} if precompile else {}
+                build_result = self.build_manager.build_project(project, 'production', **overrides)
                 if not build_result.success:
                     print("❌ Failed to build project")
                     return False
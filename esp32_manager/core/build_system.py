@@ -12,7 +12,7 @@ import shutil
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Any, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import logging
 import json
 
@@ -21,6 +21,9 @@ from esp32_manager.utils.exceptions import ProjectValidationError
 
 logger = logging.getLogger(__name__)
 
+# Scripts the firmware executes by file name; these are never cross-compiled
+ENTRY_SCRIPTS = ('boot.py', 'main.py')
+
 
 @dataclass
 class BuildResult:
@@ -535,9 +538,10 @@ class BuildSystem:
             "files": self._get_file_list(build_dir)
         }
 
+        # Compact separators keep json on its C encoder (indent forces the
+        # pure-Python one), and the result goes out in a single write
         metadata_file = build_dir / "build_metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_file.write_bytes(json.dumps(metadata, separators=(',', ':')).encode('utf-8'))
 
     @staticmethod
     def _get_file_list(directory: Path) -> List[Dict[str, Any]]:
@@ -572,25 +576,33 @@ class BuildSystem:
     @staticmethod
     def _cross_compile_project(build_dir: Path, build_config: BuildConfig):
         """Cross-compile Python files using mpy-cross if available."""
+        if shutil.which(build_config.mpy_cross_path) is None:
+            logger.warning(f"mpy-cross not found at {build_config.mpy_cross_path}, skipping cross-compilation")
+            return
+
         logger.info("Cross-compiling to bytecode...")
 
         python_files = list(build_dir.rglob("*.py"))
 
         for py_file in python_files:
+            # MicroPython only runs boot.py/main.py from source
+            if py_file.name in ENTRY_SCRIPTS:
+                continue
+
             mpy_file = py_file.with_suffix('.mpy')
             try:
                 cmd = [build_config.mpy_cross_path, *build_config.mpy_cross_flags,
                        '-o', str(mpy_file), str(py_file)]
                 subprocess.run(cmd, check=True)
 
-                if build_config.minify_code:
-                    py_file.unlink()
+                # The import system prefers foo.py over foo.mpy, so the source
+                # has to go for the bytecode to be picked up on the device
+                py_file.unlink()
 
                 logger.debug(f"Compiled {py_file.name} to {mpy_file.name}")
 
             except Exception as e:
-                logger.warning(f"Failed to cross-compile {py_file}: {e}. Copying source file.")
-                shutil.copy2(py_file, mpy_file)
+                logger.warning(f"Failed to cross-compile {py_file}: {e}. Keeping source file.")
 
     @staticmethod
     def _package_build(build_dir: Path, build_config: BuildConfig):
@@ -657,11 +669,17 @@ class BuildManager:
         return self.build_configs.get(name)
 
     def build_project(self, project_config: ProjectConfig,
-                     config_name: str = "default") -> BuildResult:
-        """Build project with named configuration."""
+                     config_name: str = "default", **overrides) -> BuildResult:
+        """Build project with named configuration.
+
+        Keyword overrides (e.g. ``cross_compile=True``) replace fields of the
+        named configuration for this build only.
+        """
         build_config = self.build_configs.get(config_name)
         if build_config is None:
             build_config = BuildConfig()  # Use default
+        if overrides:
+            build_config = replace(build_config, **overrides)
 
         return self.build_system.build_project(project_config, build_config)
 
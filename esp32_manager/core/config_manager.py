@@ -7,7 +7,7 @@ from typing import List, Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration."""
     name: str
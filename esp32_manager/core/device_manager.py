@@ -529,13 +529,15 @@ class ESP32DeviceManager:
             logger.error(f"Device {port} not found")
             return False
 
-        if port in self.connections:
-            if self.connections[port].is_connected:
+        connection = self.connections.get(port)
+        if connection is not None:
+            if connection.is_connected:
                 return True
-            else:
-                self.connections[port].disconnect()
+            connection.disconnect()
 
-        connection = SerialConnection(port, baud_rate)
+        # A dropped connection at the same baud rate is reopened in place
+        if connection is None or connection.baud_rate != baud_rate:
+            connection = SerialConnection(port, baud_rate)
         if connection.connect():
             self.connections[port] = connection
             self.devices[port].state = DeviceState.CONNECTED
@@ -1,5 +1,7 @@
 import json
+import os
 import shutil
+import tempfile
 import importlib
 import inspect
 import pkgutil
@@ -12,6 +14,10 @@ from esp32_manager.utils.exceptions import ProjectValidationError
 from esp32_manager.plugins.base_plugin import BasePlugin
 
 
+# Characters that are not allowed in project (directory) names
+_INVALID_NAME_CHARS = frozenset(r'<>:"/\|?*')
+
+
 class ProjectManager:
     """Core project management functionality."""
     def __init__(self, workspace_dir: Path):
@@ -40,19 +46,22 @@ class ProjectManager:
 
     def load_projects(self) -> bool:
         """Load project configuration from file."""
-        if not self.config_file.exists():
+        try:
+            # Opening directly replaces a separate exists() stat call
+            data = json.loads(self.config_file.read_bytes())
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Failed to load projects: {e}")
             return False
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Load projects
+            for name, config_data in data.get('projects', {}).items():
+                self.projects[name] = ProjectConfig.from_dict(config_data)
 
-                # Load projects
-                for name, config_data in data.get('projects', {}).items():
-                    self.projects[name] = ProjectConfig.from_dict(config_data)
-
-                # Load current project
-                self.current_project = data.get('current_project')
+            # Load current project
+            self.current_project = data.get('current_project')
 
             logger.info(f"Loaded {len(self.projects)} projects")
             return True
@@ -124,8 +133,20 @@ class ProjectManager:
                 backup_file = self.config_file.with_suffix('.json.bak')
                 shutil.copy2(self.config_file, backup_file)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Write beside the old file and swap it in with one rename, so
+            # projects.json always exists and is never partially written.
+            # The temp name is unique, so concurrent savers cannot clobber it
+            tmp = tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=self.config_file.parent,
+                prefix=self.config_file.name + '.', suffix='.tmp', delete=False,
+            )
+            try:
+                with tmp:
+                    json.dump(data, tmp, indent=2)
+                os.replace(tmp.name, self.config_file)
+            except BaseException:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
 
             logger.info("Projects saved successfully")
             return True
@@ -141,7 +162,7 @@ class ProjectManager:
         if name in self.projects:
             raise ProjectValidationError(f"Project '{name}' already exists")
 
-        if any(char in name for char in r'<>:"/\|?*'):
+        if not _INVALID_NAME_CHARS.isdisjoint(name):
             raise ProjectValidationError("Project name contains invalid characters")
 
         return True
@@ -151,8 +172,13 @@ class ProjectManager:
                        description: str = "",
                        template: str = "basic",
                        author: str = "",
-                       tags: List[str] = None) -> ProjectConfig:
-        """Create a new ESP32 project."""
+                       tags: List[str] = None,
+                       disabled_features: List[str] = None) -> ProjectConfig:
+        """Create a new ESP32 project.
+
+        ``disabled_features`` names optional template features to leave out
+        of the generated code; it is kept in the project's build config.
+        """
         self.validate_project_name(name)
 
         project_path = self.workspace_dir / name
@@ -166,6 +192,8 @@ class ProjectManager:
             author=author,
             tags=tags or []
         )
+        if disabled_features:
+            config.build_config['disabled_features'] = sorted(set(disabled_features))
 
         # Create project structure
         self._create_project_structure(project_path, template, config)
@@ -193,15 +221,9 @@ class ProjectManager:
             (project_path / dir_name).mkdir(parents=True, exist_ok=True)
 
         # Create files from template
-        from ..templates import get_template_files
+        from ..templates import get_template_files, write_project_files
         template_files = get_template_files(template, config)
-
-        for file_path, content in template_files.items():
-            full_path = project_path / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        write_project_files(template_files, project_path)
 
         # Create project-specific config
         project_config_file = project_path / 'project.json'
@@ -317,25 +339,23 @@ class ProjectManager:
         }
 
         if src_path.is_dir():
-            for file_path in src_path.rglob('*'):
-                if not file_path.is_file():
-                    continue
-
+            for entry in self._iter_files(src_path):
                 stats['files'] += 1
                 try:
-                    stats['size_bytes'] += file_path.stat().st_size
+                    stats['size_bytes'] += entry.stat().st_size
                 except OSError as e:
-                    logger.warning("Could not stat %s: %s", file_path, e)
+                    logger.warning("Could not stat %s: %s", entry.path, e)
                     continue
 
-                if file_path.suffix == '.py':
+                if entry.name.endswith('.py'):
                     stats['python_files'] += 1
                     try:
                         # read in one go is often faster than readlines()
-                        content = file_path.read_text(encoding='utf-8')
+                        with open(entry.path, encoding='utf-8') as f:
+                            content = f.read()
                         stats['lines_of_code'] += content.count("\n") + 1
                     except (UnicodeDecodeError, OSError) as e:
-                        logger.warning("Could not read %s: %s", file_path, e)
+                        logger.warning("Could not read %s: %s", entry.path, e)
 
         # Count test_*.py in tests/
         if tests_path.exists():
@@ -343,6 +363,25 @@ class ProjectManager:
 
         return stats
 
+    @classmethod
+    def _iter_files(cls, path: Path | str):
+        """Yield ``os.DirEntry`` objects for all files below ``path``.
+
+        Uses :func:`os.scandir` so file types come from the directory
+        listing instead of a ``stat`` call per entry.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning("Could not list %s: %s", path, e)
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from cls._iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
     def search_projects(self, query: str) -> List[ProjectConfig]:
         """Search projects by name, description, or tags."""
         query = query.lower()
@@ -397,18 +436,21 @@ class ProjectManager:
                 tmp_path = Path(tmp_dir)
 
                 # Handle archives that contain a single root directory
-                entries = list(tmp_path.iterdir())
-                if len(entries) == 1 and entries[0].is_dir():
-                    project_root = entries[0]
+                with os.scandir(tmp_dir) as it:
+                    entries = list(it)
+                if len(entries) == 1 and entries[0].is_dir(follow_symlinks=False):
+                    project_root = Path(entries[0].path)
                 else:
                     project_root = tmp_path
 
-                project_json = project_root / 'project.json'
-
-                if project_json.exists():
-                    with open(project_json, 'r', encoding='utf-8') as f:
+                try:
+                    # Opening directly saves an exists() stat for the common case
+                    with open(project_root / 'project.json', 'r', encoding='utf-8') as f:
                         data = json.load(f)
+                except FileNotFoundError:
+                    data = None
 
+                if data is not None:
                     proj_name = name or data.get('name') or archive_path.stem
                     self.validate_project_name(proj_name)
 
@@ -428,7 +470,7 @@ class ProjectManager:
                 shutil.move(str(project_root), str(final_path))
 
                 # Write project.json if it didn't exist
-                if not (final_path / 'project.json').exists():
+                if data is None:
                     with open(final_path / 'project.json', 'w', encoding='utf-8') as f:
                         json.dump(config.to_dict(), f, indent=2)
         except Exception as e:
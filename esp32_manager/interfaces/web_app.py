@@ -1,10 +1,16 @@
 import asyncio
+import codecs
+import functools
 import json
+import logging
+import os
+import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
-from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi import Depends, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -13,8 +19,72 @@ from pydantic import BaseModel
 
 from esp32_manager.core.project_manager import ProjectManager
 from esp32_manager.core.build_system import BuildManager
+from esp32_manager.core.config_manager import ProjectConfig as CoreProjectConfig
 from esp32_manager.core.device_manager import ESP32DeviceManager
 
+# Optional psutil import for the system status endpoint
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are streamed to the client instead of being
+# embedded in a JSON body.
+STREAM_THRESHOLD = 256 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Seconds a /api/system/status snapshot is reused before resampling.
+SYSTEM_STATUS_TTL = 1.0
+
+
+def _iter_file_chunks(path: Path, chunk_size: int = STREAM_CHUNK_SIZE):
+    """Yield the raw contents of *path* in fixed-size blocks.
+
+    Starlette iterates synchronous generators in its threadpool, so the
+    blocking reads never run on the event loop.
+    """
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            yield chunk
+
+
+def _is_utf8_text(path: Path, sample_size: int = STREAM_CHUNK_SIZE) -> bool:
+    """Check whether the first *sample_size* bytes of *path* decode as UTF-8.
+
+    An incremental decoder is used so a multi-byte character cut off at the
+    end of the sample does not count as invalid.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Write *content* to *path* through a temporary file and ``os.replace``."""
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=4096)
+def _iso(ts: float) -> str:
+    """Format a POSIX timestamp as a local ISO-8601 string (memoized)."""
+    return datetime.fromtimestamp(ts).isoformat()
+
+
 # Data models for better type safety
 class ProjectCreateRequest(BaseModel):
     name: str
@@ -85,6 +155,13 @@ def create_app(
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
     templates = Jinja2Templates(directory=str(templates_dir))
 
+    def get_project_or_404(project_name: str) -> CoreProjectConfig:
+        """Resolve the ``project_name`` path parameter or fail with 404."""
+        project = project_manager.get_project(project_name)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return project
+
     @app.get("/", response_class=HTMLResponse)
     async def index(request: Request):
         """Render dashboard page."""
@@ -93,7 +170,7 @@ def create_app(
             status = build_manager.get_build_status(p.name)
             last_success = status.get("last_success")
             if last_success:
-                last_success = datetime.fromtimestamp(last_success).isoformat()
+                last_success = _iso(last_success)
             proj = p.to_dict()
             proj["last_success"] = last_success
             projects.append(proj)
@@ -108,27 +185,62 @@ def create_app(
             }
         )
 
-    @app.get("/api/events")
-    async def stream_events():
-        """SSE endpoint with corrected typo."""
-        async def event_generator():
-            while True:
+    # Latest SSE frame, built once per tick and shared by every subscriber
+    sse_state = {"payload": None, "task": None}
+    sse_update = asyncio.Event()
+
+    async def sse_producer():
+        while True:
+            # A failed snapshot must not end the loop: subscribers only
+            # wake when it ticks, so they would wait forever
+            try:
                 projects = []
                 for p in project_manager.list_projects():
                     status = build_manager.get_build_status(p.name)
                     last_success = status.get("last_success")
                     if last_success:
-                        last_success = datetime.fromtimestamp(last_success).isoformat()
+                        last_success = _iso(last_success)
                     proj = p.to_dict()
                     proj["last_success"] = last_success
                     projects.append(proj)
 
                 data = {
                     "projects": projects,
-                    "devices": [d.to_dict() for d in device_manager.get_devices()]  # FIXED: typo
+                    "devices": [d.to_dict() for d in device_manager.get_devices()]
                 }
-                yield f"data: {json.dumps(data)}\n\n"
-                await asyncio.sleep(5)
+                sse_state["payload"] = f"data: {json.dumps(data)}\n\n".encode("utf-8")
+                # Wake every waiting subscriber, then re-arm for the next tick
+                sse_update.set()
+                sse_update.clear()
+            except Exception:
+                logger.exception("Failed to build SSE snapshot")
+            await asyncio.sleep(5)
+
+    @app.on_event("shutdown")
+    async def stop_sse_producer():
+        """Cancel the shared SSE producer so it does not outlive the app."""
+        task = sse_state["task"]
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        sse_state["task"] = None
+
+    @app.get("/api/events")
+    async def stream_events():
+        """SSE endpoint streaming the shared project/device snapshot."""
+        task = sse_state["task"]
+        if task is None or task.done():
+            sse_state["task"] = asyncio.create_task(sse_producer())
+
+        async def event_generator():
+            if sse_state["payload"] is not None:
+                yield sse_state["payload"]
+            while True:
+                await sse_update.wait()
+                yield sse_state["payload"]
 
         return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -169,7 +281,7 @@ def create_app(
             stats = project_manager.get_project_stats(p.name)
             last_success = status.get("last_success")
             if last_success:
-                last_success = datetime.fromtimestamp(last_success).isoformat()
+                last_success = _iso(last_success)
 
             proj = p.to_dict()
             proj.update({
@@ -212,115 +324,127 @@ def create_app(
             raise HTTPException(status_code=404, detail=str(e))
 
     @app.get("/api/projects/{project_name}/files")
-    async def list_project_files(project_name: str):
+    async def list_project_files(project: CoreProjectConfig = Depends(get_project_or_404)):
         """List all files in a project with metadata."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        def get_file_tree(path: Path, relative_to: Path) -> List[Dict]:
-            """Recursively build file tree."""
-            items = []
-            if path.is_dir():
-                for item in sorted(path.iterdir()):
-                    if item.name.startswith('.'):
-                        continue
-
-                    rel_path = item.relative_to(relative_to)
-                    if item.is_dir():
-                        items.append({
-                            "name": item.name,
-                            "path": str(rel_path),
-                            "type": "file",
-                            "size": item.stat().st_size,
-                            "modified": datetime.fromtimestamp(item.stat().st_mtime).isoformat()
-                        })
-            return items
-        project_path = Path(project.path)
-        files = get_file_tree(project_path, project_path)
+        def get_file_tree(root: Path) -> List[Dict]:
+            """Walk *root* iteratively and return a flat listing of its files."""
+            base = str(root).rstrip(os.sep) + os.sep
+            base_len = len(base)
+            entries = []
+            stack = [str(root)]
+            while stack:
+                try:
+                    scanner = os.scandir(stack.pop())
+                except OSError:
+                    continue
+                with scanner:
+                    for entry in scanner:
+                        if entry.name.startswith('.'):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        # Relative path via slicing instead of Path.relative_to
+                        entries.append((entry.path[base_len:], entry.name, st.st_size, st.st_mtime))
+
+            entries.sort()
+            return [
+                {
+                    "name": name,
+                    "path": rel_path,
+                    "type": "file",
+                    "size": size,
+                    "modified": _iso(mtime)
+                }
+                for rel_path, name, size, mtime in entries
+            ]
+        files = get_file_tree(project.path)
         return {"files": files}
 
     @app.get("/api/projects/{project_name}/files/{file_path:path}")
-    async def get_file_content(project_name: str, file_path: str):
+    async def get_file_content(file_path: str, project: CoreProjectConfig = Depends(get_project_or_404)):
         """Get file content for editing."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        full_path = Path(project.path) / file_path
+        full_path = project.path / file_path
         if not full_path.exists() or not full_path.is_file():
             raise HTTPException(status_code=404, detail="File not found")
 
+        st = full_path.stat()
+        if st.st_size > STREAM_THRESHOLD:
+            # Same policy as the small-file path: binary content is refused
+            if not await asyncio.to_thread(_is_utf8_text, full_path):
+                raise HTTPException(status_code=404, detail="File ia not text-readable")
+            return StreamingResponse(
+                _iter_file_chunks(full_path),
+                media_type="text/plain; charset=utf-8",
+                headers={"X-Accel-Buffering": "no"},
+            )
+
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = await asyncio.to_thread(full_path.read_text, encoding='utf-8')
             return {
                 "content": content,
                 "path": file_path,
-                "size": full_path.stat().st_size,
-                "modified:": datetime.fromtimestamp(full_path.stat().st_mtime)
+                "size": st.st_size,
+                "modified:": _iso(st.st_mtime)
             }
         except UnicodeDecodeError:
             raise HTTPException(status_code=404, detail="File ia not text-readable")
 
     @app.put("/api/projects/{project_name}/files/{file_path:path}")
-    async def save_file_content(project_name: str, file_path: str, request: FileContent):
+    async def save_file_content(
+            file_path: str,
+            request: FileContent,
+            project: CoreProjectConfig = Depends(get_project_or_404),
+    ):
         """Save edited file content."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        full_path = Path(project.path) / file_path
+        full_path = project.path / file_path
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(request.content)
+            await asyncio.to_thread(_atomic_write_text, full_path, request.content)
             return {
                 "success": True,
                 "size": full_path.stat().st_size,
-                " modified": datetime.fromtimestamp(full_path.stat().st_mtime).isoformat()
+                " modified": _iso(full_path.stat().st_mtime)
             }
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
     @app.post("/api/projects/{project_name}/files/{file_path:path}")
-    async def create_file(project_name: str, file_path: str, request: FileContent):
+    async def create_file(
+            file_path: str,
+            request: FileContent,
+            project: CoreProjectConfig = Depends(get_project_or_404),
+    ):
         """Create a new file."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        full_path = Path(project.path) / file_path
+        full_path = project.path / file_path
         if full_path.exists():
             raise HTTPException(status_code=409, detail="File already exists")
 
         full_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(request.content)
+            await asyncio.to_thread(_atomic_write_text, full_path, request.content)
             return {"success": True, "path": file_path}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to create file: {str(e)}")
 
     @app.delete("/api/projects/{project_name}/files/{file_path:path}")
-    async def delete_file(project_name: str, file_path: str):
+    async def delete_file(file_path: str, project: CoreProjectConfig = Depends(get_project_or_404)):
         """Delete a file."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        full_path = Path(project.path) / file_path
+        full_path = project.path / file_path
         if not full_path.exists():
             raise HTTPException(status_code=404, detail="File not found")
 
         try:
             if full_path.is_file():
-                full_path.unlink()
+                await asyncio.to_thread(full_path.unlink)
             elif full_path.is_dir():
-                import shutil
-                shutil.rmtree(full_path)
+                await asyncio.to_thread(shutil.rmtree, full_path)
             return {"success": True}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to delete file: {str(e)}")
@@ -330,18 +454,20 @@ def create_app(
         await manager.connect(websocket, "build", project_name)
         try:
             while True:
-                # Keep connection alive
-                await asyncio.sleep(1)
+                # Park on the socket until the client goes away
+                await websocket.receive_text()
         except WebSocketDisconnect:
+            pass
+        finally:
             manager.disconnect(websocket, "build", project_name)
 
     @app.post("/api/deploy/{project_name}")
-    async def deploy_project_endpoint(project_name: str, request: DeployRequest):
+    async def deploy_project_endpoint(
+            project_name: str,
+            request: DeployRequest,
+            project: CoreProjectConfig = Depends(get_project_or_404),
+    ):
         """Build and deploy a project to an ESP32 device with progress tracking."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
         # Send deploy start notification
         await manager.broadcast_build_progress({
             "type": "deploy_start",
@@ -390,13 +516,9 @@ def create_app(
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/api/projects/{project_name}/config")
-    async def get_project_config(project_name: str):
+    async def get_project_config(project: CoreProjectConfig = Depends(get_project_or_404)):
         """Get project congiguration."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        config_path = Path(project.path) / "esp32_config.json"
+        config_path = project.path / "esp32_config.json"
         if config_path.exists():
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = json.load(f)
@@ -418,13 +540,12 @@ def create_app(
         return {"config": config}
 
     @app.put("/api/projects/{project_name}/config")
-    async def update_project_config(project_name: str, config: ProjectConfig):
+    async def update_project_config(
+            config: ProjectConfig,
+            project: CoreProjectConfig = Depends(get_project_or_404),
+    ):
         """Update project congiguration."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
-        config_path = Path(project.path) / "esp32_config.json"
+        config_path = project.path / "esp32_config.json"
         config_data = {
             "build_settings": config.build_settings,
             "deploy_settings": config.deployment_settings,
@@ -432,19 +553,14 @@ def create_app(
         }
 
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                json.dump(config_path, f, indent=2)
+            await asyncio.to_thread(_atomic_write_text, config_path, json.dumps(config_data, indent=2))
             return {"success": True}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to save config: {str(e)}")
 
     @app.post("/api/build/{project_name}")
-    async def build_project(project_name: str):
+    async def build_project(project_name: str, project: CoreProjectConfig = Depends(get_project_or_404)):
         """Start a build for the given project with real-time progress.."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
         # Send build start notification
         await manager.broadcast_build_progress({
             "type": "build_start",
@@ -480,17 +596,13 @@ def create_app(
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/api/projects/{project_name}/info")
-    async def get_project_info(project_name: str):
+    async def get_project_info(project_name: str, project: CoreProjectConfig = Depends(get_project_or_404)):
         """Return detailed info and stats for a project."""
-        project = project_manager.get_project(project_name)
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-
         stats = project_manager.get_project_stats(project_name)
         build_status = build_manager.get_build_status(project_name)
         last_success = build_status.get("last_success")
         if last_success:
-            last_success = datetime.fromtimestamp(last_success).isoformat()
+            last_success = _iso(last_success)
         return {
             "project": project.to_dict(),
             "stats": stats,
@@ -543,19 +655,31 @@ def create_app(
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    # System metrics are sampled at most once per SYSTEM_STATUS_TTL seconds
+    # so concurrent dashboards share one cpu_percent() delta.
+    system_status_cache = {"ts": 0.0, "value": None}
+    if PSUTIL_AVAILABLE:
+        # Establish the cpu_percent baseline; the first call always returns 0.0
+        psutil.cpu_percent(interval=None)
+
     @app.get("/api/system/status")
     async def get_system_status():
         """Get system health and resource information."""
-        import psutil
-
-        return {
-            "cpu_percent": psutil.cpu_percent(),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_usage": psutil.disk_usage("/").percent,
-            "active_projects": len(project_manager.list_projects()),
-            "connected_devices": len(device_manager.get_devices()),
-            "uptime": datetime.now().isoformat()
-        }
+        if not PSUTIL_AVAILABLE:
+            raise HTTPException(status_code=503, detail="psutil is not installed")
+
+        now = time.monotonic()
+        if system_status_cache["value"] is None or now - system_status_cache["ts"] > SYSTEM_STATUS_TTL:
+            system_status_cache["value"] = {
+                "cpu_percent": psutil.cpu_percent(interval=None),
+                "memory_percent": psutil.virtual_memory().percent,
+                "disk_usage": psutil.disk_usage("/").percent,
+                "active_projects": len(project_manager.list_projects()),
+                "connected_devices": len(device_manager.get_devices()),
+                "uptime": datetime.now().isoformat()
+            }
+            system_status_cache["ts"] = now
+        return system_status_cache["value"]
 
     @app.get("/api/build-queue")
     async def get_build_queue():
@@ -1,6 +1,7 @@
 """Git integration plugin for ESP32Manager."""
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -14,10 +15,10 @@ class GitIntegrationPlugin(BasePlugin):
 
     def load(self) -> None:
         """Verify that Git is available."""
-        try:
-            subprocess.run(["git", "--version"], check=True, capture_output=True)
-        except Exception as exc:
-            raise RuntimeError("Git executable not found") from exc
+        # A PATH lookup, not a `git --version` run: plugins load on every
+        # ProjectManager start, and spawning git there is comparatively slow
+        if shutil.which("git") is None:
+            raise RuntimeError("Git executable not found")
 
     # Helper methods ----
     @staticmethod
@@ -48,11 +49,15 @@ class GitIntegrationPlugin(BasePlugin):
 
     def commit_all(self, path: Path, message: str) -> None:
         """Commit all changes in the repository with *message*."""
-        # Configure identity locally to avoid global config requirements
-        self._run_git(path, "config", "user.email", "esp32@example.com")
-        self._run_git(path, "config", "user.name", "ESP32Manager")
         self._run_git(path, "add", "-A")
-        self._run_git(path, "commit", "-m", message)
+        # Identity is passed per command to avoid global config requirements,
+        # which saves two `git config` processes per commit
+        self._run_git(
+            path,
+            "-c", "user.email=esp32@example.com",
+            "-c", "user.name=ESP32Manager",
+            "commit", "-m", message,
+        )
 
     def get_status(self, path: Path) -> str:
         """Return the short git status for the repository at *path*."""
@@ -1,22 +1,26 @@
-from typing import Dict, List
+from typing import Dict, List, Type, Union
+import importlib
 import logging
 
 
-from esp32_manager.templates.base import BaseTemplate
-from esp32_manager.templates.basic import BasicTemplate
-from esp32_manager.templates.iot import IoTTemplate
-# from esp32_manager.templates.sensor import SensorTemplate
-# from esp32_manager.templates.webserver import WebServerTemplate
+from esp32_manager.templates.base import BaseTemplate, write_project_files
 
 logger = logging.getLogger(__name__)
 
+# Template name -> (module, class). Modules are imported on first use so
+# commands that never scaffold a project don't load the template sources.
 TEMPLATES = {
-    'basic': BasicTemplate,
-    'iot': IoTTemplate,
-    # 'sensor': SensorTemplate,
-    # 'webserver': WebServerTemplate,
+    'basic': ('esp32_manager.templates.basic', 'BasicTemplate'),
+    'iot': ('esp32_manager.templates.iot', 'IoTTemplate'),
+    # 'sensor': ('esp32_manager.templates.sensor', 'SensorTemplate'),
+    # 'webserver': ('esp32_manager.templates.webserver', 'WebServerTemplate'),
 }
 
+def _load_template_class(template_name: str) -> Type[BaseTemplate]:
+    """Import and return the class registered for *template_name*."""
+    module_name, class_name = TEMPLATES[template_name]
+    return getattr(importlib.import_module(module_name), class_name)
+
 def get_available_templates() -> List[str]:
     """Get list of available template names."""
     return list(TEMPLATES.keys())
@@ -26,7 +30,7 @@ def get_template_info(template_name: str) -> Dict[str, str]:
     if template_name not in TEMPLATES:
         raise ValueError(f"Template '{template_name}' not found.")
 
-    template_class = TEMPLATES[template_name]
+    template_class = _load_template_class(template_name)
     return {
         'name': template_name,
         'description': template_class.description,
@@ -36,12 +40,12 @@ def get_template_info(template_name: str) -> Dict[str, str]:
         'features': getattr(template_class, 'features', []),
     }
 
-def get_template_files(template_name: str, config) -> Dict[str, str]:
+def get_template_files(template_name: str, config) -> Dict[str, Union[str, bytes]]:
     """Get template files for project creation."""
     if template_name not in TEMPLATES:
         raise ValueError(f"Template '{template_name}' not found.")
 
-    template_class = TEMPLATES[template_name]
+    template_class = _load_template_class(template_name)
     template_instance = template_class(config)
 
     try:
@@ -57,7 +61,7 @@ def validate_template(template_name: str) -> bool:
     if template_name not in TEMPLATES:
         raise False
 
-    template_class = TEMPLATES[template_name]
+    template_class = _load_template_class(template_name)
 
     # Check required attributes
     required_attrs = ['description', 'generate_files']
@@ -1,44 +1,53 @@
-from typing import List, Dict
+from __future__ import annotations
 
-class BaseTemplate:
-    """Base class for all project templates."""
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from string import Template
 
-    description: str = "Base template"
-    author: str = "ESP32Manager"
-    version: str = "1.0.0"
-    dependencies: List[str] = []
-    features: List[str] = []
+_GITIGNORE = """# Byte-compiled / optimized / DLL files
+__pycache__/
+*.py[cod]
+*$py.class
 
-    def __init__(self, config):
-        self.config = config
-        self.project_name = config.name
-        self.description = config.description
-        self.author = config.author
+# MicroPython
+*.mpy
 
-    def generate_files(self) ->  Dict[str, str]:
-        """Generate project files. Must be implemented by subclasses."""
-        raise NotImplementedError("Subclasses must implement generate_files")
+# IDE
+.vscode/
+.idea/
 
-    def get_common_files(self) -> Dict[str, str]:
-        """Get common files that all templates should have."""
-        return {
-            'README.md': self._generate_readme(),
-            '.gitignore': self._generate_gitignore(),
-            'requirements.txt': self._generate_requirements(),
-            'projects.json': self._generate_project_config(),
-        }
+# OS
+.DS_Store
+Thumbs.db
 
-    def _generate_readme(self) -> str:
-        """Generate README.md content."""
-        return f"""# {self.project_name}
+# Project specific
+build/
+dist/
+*.log
+"""
 
-{self.description or 'ESP32 project created with ESP32Manager'}
+# Paths emitted by every template. Interned once so later dict lookups and
+# merges on these keys can short-circuit on identity.
+_COMMON_PATHS = tuple(map(sys.intern, (
+    'README.md',
+    '.gitignore',
+    'requirements.txt',
+    'projects.json',
+)))
+
+_NO_REQUIREMENTS = "# No additional dependencies required\n"
+
+_README_TPL = Template("""# $project_name
+
+$description
 
 ## Description
-This project was created using the **{self.__class__.__name__.replace('Template', '')}** template.
+This project was created using the **$template_name** template.
 
 ## Author
-{self.author or 'Unknown'}
+$author
 
 ## Getting Started
 
@@ -51,14 +60,14 @@ This project was created using the **{self.__class__.__name__.replace('Template'
 1. Connect your ESP32 to your computer
 2. Deploy the project using ESP32Manager:
     ```bash
-    python main.py deploy {self.project_name}
+    python main.py deploy $project_name
 
 ### Usage
-{self._get_usage_instructions()}
+$usage
 
 ## Project structure
 ```
-{self.project_name}/
+$project_name/
 ├── src/           # Source code
 ├── tests/         # Test files
 ├── docs/          # Documentation
@@ -67,11 +76,87 @@ This project was created using the **{self.__class__.__name__.replace('Template'
 ```
 
 ## Features
-{self._format_features()}
+$features
 
 ## License
 This project is licensed under the MIT License.
-"""
+""")
+
+def _write_file(path: Path, content: str | bytes) -> None:
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content, encoding='utf-8')
+
+def write_project_files(files: dict[str, str | bytes], root: Path, max_workers: int = 8) -> None:
+    """Write a ``{relative_path: content}`` mapping below *root*.
+
+    Text content is written as UTF-8, ``bytes`` content verbatim. Parent
+    directories are created up front, then the individual writes are issued
+    concurrently so their open/write syscalls overlap.
+    """
+    root = Path(root)
+    targets = [(root / rel_path, content) for rel_path, content in files.items()]
+    for parent in {path.parent for path, _ in targets}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Consume the results so the first failed write is re-raised here
+        list(pool.map(lambda item: _write_file(*item), targets))
+
+class BaseTemplate:
+    """Base class for all project templates."""
+
+    description: str = "Base template"
+    author: str = "ESP32Manager"
+    version: str = "1.0.0"
+    dependencies: list[str] = []
+    features: list[str] = []
+
+    # Per-project values live in slots; ``description``/``author`` above are
+    # template metadata, so the project's own values use distinct names.
+    __slots__ = ("config", "project_name", "project_description", "project_author")
+
+    # Template name without the ``Template`` suffix, e.g. ``Basic``
+    short_name: str = "Base"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.short_name = cls.__name__.removesuffix('Template')
+
+    def __init__(self, config):
+        self.config = config
+        self.project_name = config.name
+        self.project_description = config.description
+        self.project_author = config.author
+
+    def generate_files(self) ->  dict[str, str]:
+        """Generate project files. Must be implemented by subclasses."""
+        raise NotImplementedError("Subclasses must implement generate_files")
+
+    def write_files(self, root: Path) -> None:
+        """Generate all project files and write them below *root*."""
+        write_project_files(self.generate_files(), root)
+
+    def get_common_files(self) -> dict[str, str]:
+        """Get common files that all templates should have."""
+        return dict(zip(_COMMON_PATHS, (
+            self._generate_readme(),
+            self._generate_gitignore(),
+            self._generate_requirements(),
+            self._generate_project_config(),
+        )))
+
+    def _generate_readme(self) -> str:
+        """Generate README.md content."""
+        return _README_TPL.substitute(
+            project_name=self.project_name,
+            description=self.project_description or 'ESP32 project created with ESP32Manager',
+            template_name=self.short_name,
+            author=self.project_author or 'Unknown',
+            usage=self._get_usage_instructions(),
+            features=self._format_features(),
+        )
 
     @staticmethod
     def _get_usage_instructions() -> str:
@@ -83,49 +168,28 @@ This project is licensed under the MIT License.
         if not self.features:
             return "- Basic ESP32 functionality"
 
-        return "\n".join(f"- {feature}" for feature in self.features)
+        return "\n".join(["- " + feature for feature in self.features])
 
     @staticmethod
     def _generate_gitignore() -> str:
         """Generate .gitignore content."""
-        return """# Byte-compiled / optimized / DLL files
-__pycache__/
-*.py[cod]
-*$py.class
-
-# MicroPython
-*.mpy
-
-# IDE
-.vscode/
-.idea/
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Project specific
-build/
-dist/
-*.log
-"""
+        return _GITIGNORE
 
     def _generate_requirements(self) -> str:
         """Generate requirements.txt content."""
         if not self.dependencies:
-            return "# No additional dependencies required\n"
+            return _NO_REQUIREMENTS
 
-        return "\n".join(self.dependencies) + "\n"
+        return "".join([dependency + "\n" for dependency in self.dependencies])
 
     def _generate_project_config(self) -> str:
         """Generate project.json content."""
-        import json
         config_data = {
             'name': self.project_name,
-            'description': self.description,
-            'template': self.__class__.__name__.replace('Template', '').lower(),
+            'description': self.project_description,
+            'template': self.short_name.lower(),
             'version': '1.0.0',
-            'author': self.author,
+            'author': self.project_author,
             'created_with': 'ESP32Manager',
             'micropython_version': '1.20+',
             'board': 'esp32',
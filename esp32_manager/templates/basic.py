@@ -1,64 +1,41 @@
-from typing import Dict
-from . import BaseTemplate
+from __future__ import annotations
 
+import functools
+import sys
+from collections.abc import Mapping
+from string import Template
+from types import MappingProxyType
+from esp32_manager.templates.base import BaseTemplate
 
-class BasicTemplate(BaseTemplate):
-    """Basic ESP32 project template with minimal functionality."""
-
-    description = "Basic ESP32 project with LED control and basic I/O"
-    author = "ESP32Manager"
-    version = "1.0.0"
-    features = [
-        "Built-in LED control",
-        "GPIO pin management",
-        "Basic timer functionality",
-        "Serial communication",
-        "Error handling"
-    ]
-    dependencies = []
-
-    def generate_files(self) -> Dict[str, str]:
-        """Generate all project files."""
-        files = self.get_common_files()
-
-        # Add template-specific files
-        files.update({
-            'src/main.py': self._generate_main(),
-            'src/config.py': self._generate_config(),
-            'src/utils.py': self._generate_utils(),
-            'tests/test_main.py': self._generate_tests(),
-            'docs/API.md': self._generate_api_docs(),
-            'assets/pinout.txt': self._generate_pinout(),
-        })
-
-        return files
-
-    def _get_usage_instructions(self) -> str:
-        """Get basic template usage instructions."""
-        return """1. The built-in LED will blink every second
+# Static file bodies, built once at import time
+_USAGE_INSTRUCTIONS = """1. The built-in LED will blink every second
 2. Press the boot button to toggle LED state
 3. Check serial output for status messages
 4. Modify `src/config.py` to customize behavior"""
 
-    def _generate_main(self) -> str:
-        """Generate main.py file."""
-        return '''"""
+_MAIN_PY = '''"""
 ESP32 Basic Project - Main Application
 Created with ESP32Manager Basic Template
 """
 
 import time
 import machine
+import micropython
+from micropython import const
 from config import Config
 from utils import logger, handle_error
 
+# ticks_ms() wraps at 2**30. const() lets the viper code below use the
+# literal; a plain global would be a Python object there, which viper rejects
+TICKS_MASK = const(0x3FFFFFFF)
+
 # Initialize hardware
 led = machine.Pin(Config.LED_PIN, machine.Pin.OUT)
 button = machine.Pin(Config.BUTTON_PIN, machine.Pin.IN, machine.Pin.PULL_UP)
+blink_timer = machine.Timer(0)
 
 # State variables
 led_state = False
-last_button_state = True
 last_toggle_time = 0
 
 def setup():
@@ -70,6 +47,15 @@ def setup():
 
     # Turn off LED initially
     led.off()
+
+    # Button presses arrive as falling-edge interrupts instead of being polled
+    button.irq(trigger=machine.Pin.IRQ_FALLING, handler=check_button)
+
+    # Auto-blink is driven by a hardware timer
+    if Config.AUTO_BLINK:
+        blink_timer.init(period=Config.BLINK_INTERVAL, mode=machine.Timer.PERIODIC,
+                         callback=lambda t: toggle_led())
+
     logger("Setup complete!")
 
 def toggle_led():
@@ -84,42 +70,30 @@ def toggle_led():
         led.off()
         logger("LED: OFF")
 
-def check_button():
-    """Check button state and handle presses."""
-    global last_button_state, last_toggle_time
+@micropython.viper
+def debounce_elapsed(now: int, last: int, window: int) -> bool:
+    """Return True once more than `window` ms separate two ticks_ms() values."""
+    return ((now - last) & TICKS_MASK) > window
 
-    current_button_state = button.value()
-    current_time = time.ticks_ms()
+def check_button(pin):
+    """Button IRQ handler: toggle the LED, ignoring contact bounce."""
+    global last_toggle_time
 
-    # Button pressed (with debounce)
-    if not current_button_state and last_button_state:
-        if time.ticks_diff(current_time, last_toggle_time) > Config.DEBOUNCE_TIME:
-            toggle_led()
-            last_toggle_time = current_time
-            logger("Button pressed - LED toggled")
-
-    last_button_state = current_button_state
+    current_time = time.ticks_ms()
+    if debounce_elapsed(current_time, last_toggle_time, Config.DEBOUNCE_TIME):
+        toggle_led()
+        last_toggle_time = current_time
+        logger("Button pressed - LED toggled")
 
 def main_loop():
     """Main application loop."""
     logger("Entering main loop...")
-    last_blink_time = time.ticks_ms()
 
     try:
         while True:
-            current_time = time.ticks_ms()
-
-            # Check button
-            check_button()
-
-            # Auto-blink LED if enabled
-            if Config.AUTO_BLINK:
-                if time.ticks_diff(current_time, last_blink_time) >= Config.BLINK_INTERVAL:
-                    toggle_led()
-                    last_blink_time = current_time
-
-            # Small delay to prevent excessive CPU usage
-            time.sleep_ms(Config.LOOP_DELAY)
+            # Nothing to poll: the button IRQ and blink timer do the work.
+            # Sleeping idles the CPU while still servicing their callbacks.
+            time.sleep_ms(Config.IDLE_SLEEP)
 
     except KeyboardInterrupt:
         logger("Program interrupted by user")
@@ -127,6 +101,8 @@ def main_loop():
         handle_error("Main loop error", e)
     finally:
         # Cleanup
+        blink_timer.deinit()
+        button.irq(handler=None)
         led.off()
         logger("Program terminated")
 
@@ -142,9 +118,7 @@ if __name__ == "__main__":
     main()
 '''
 
-    def _generate_config(self) -> str:
-        """Generate config.py file."""
-        return '''"""
+_CONFIG_PY = '''"""
 ESP32 Basic Project Configuration
 Modify these settings to customize behavior
 """
@@ -159,7 +133,7 @@ class Config:
     # Timing Configuration
     BLINK_INTERVAL = 1000    # LED blink interval in milliseconds
     DEBOUNCE_TIME = 200      # Button debounce time in milliseconds
-    LOOP_DELAY = 50          # Main loop delay in milliseconds
+    IDLE_SLEEP = 1000        # Main loop idle sleep in milliseconds
 
     # Feature Flags
     AUTO_BLINK = True        # Enable automatic LED blinking
@@ -200,9 +174,7 @@ if __name__ != "__main__":
     validate_config()
 '''
 
-    def _generate_utils(self) -> str:
-        """Generate utils.py file."""
-        return '''"""
+_UTILS_PY = '''"""
 ESP32 Basic Project Utilities
 Common utility functions and helpers
 """
@@ -210,11 +182,12 @@ Common utility functions and helpers
 import time
 import sys
 import gc
+from collections import deque
 from config import Config
 
 def logger(message, level="INFO"):
     """Simple logging function."""
-    if Config.VERBOSE_LOGGING or level in ["ERROR", "CRITICAL"]:
+    if Config.VERBOSE_LOGGING or level in ("ERROR", "CRITICAL"):
         timestamp = time.ticks_ms()
         print(f"[{timestamp:08d}] {level}: {message}")
 
@@ -316,32 +289,37 @@ class SimpleTimer:
         self.last_time = time.ticks_ms()
 
 class MovingAverage:
-    """Simple moving average calculator."""
+    """Moving average over a fixed window with O(1) updates."""
 
     def __init__(self, window_size=10):
         self.window_size = window_size
-        self.values = []
+        self.reset()
 
     def add_value(self, value):
         """Add a value to the moving average."""
+        if self._count == self.window_size:
+            # Window full: drop the oldest value from the running sum
+            self._sum -= self.values.popleft()
+        else:
+            self._count += 1
         self.values.append(value)
-        if len(self.values) > self.window_size:
-            self.values.pop(0)
+        self._sum += value
 
     def get_average(self):
         """Get current moving average."""
-        if not self.values:
+        if not self._count:
             return 0
-        return sum(self.values) / len(self.values)
+        return self._sum / self._count
 
     def reset(self):
         """Reset the moving average."""
-        self.values.clear()
+        # MicroPython's deque takes maxlen positionally and has no clear()
+        self.values = deque((), self.window_size)
+        self._count = 0
+        self._sum = 0
 '''
 
-    def _generate_tests(self) -> str:
-        """Generate test file."""
-        return '''"""
+_TEST_MAIN_PY = '''"""
 Tests for ESP32 Basic Project
 Run these tests to verify functionality
 """
@@ -354,9 +332,17 @@ from unittest.mock import Mock, patch
 import sys
 sys.modules['machine'] = Mock()
 
+# Viper-decorated functions run as plain Python on the host
+micropython_stub = Mock()
+micropython_stub.const = lambda value: value
+micropython_stub.viper = lambda func: func
+micropython_stub.native = lambda func: func
+sys.modules['micropython'] = micropython_stub
+
 # Import modules to test
 from src.config import Config, validate_config
 from src.utils import logger, SimpleTimer, MovingAverage
+from src.pin_caps import has_cap, is_output_capable, ADC, IN_ONLY
 
 class TestConfig(unittest.TestCase):
     """Test configuration validation."""
@@ -411,6 +397,22 @@ class TestUtils(unittest.TestCase):
         avg.add_value(40)  # Should remove 10
         self.assertEqual(avg.get_average(), 30)  # (20+30+40)/3
 
+class TestPinCaps(unittest.TestCase):
+    """Test pin capability tables."""
+
+    def test_has_cap(self):
+        """Test capability lookups."""
+        self.assertTrue(has_cap(34, IN_ONLY))
+        self.assertTrue(has_cap(32, ADC))
+        self.assertFalse(has_cap(2, ADC))
+        self.assertFalse(has_cap(40, ADC))
+
+    def test_output_capable(self):
+        """Test output pin check."""
+        self.assertTrue(is_output_capable(Config.LED_PIN))
+        self.assertFalse(is_output_capable(35))
+        self.assertFalse(is_output_capable(6))
+
 class TestIntegration(unittest.TestCase):
     """Integration tests."""
 
@@ -440,6 +442,7 @@ def run_tests():
     # Add test cases
     suite.addTests(loader.loadTestsFromTestCase(TestConfig))
     suite.addTests(loader.loadTestsFromTestCase(TestUtils))
+    suite.addTests(loader.loadTestsFromTestCase(TestPinCaps))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
 
     # Run tests
@@ -467,9 +470,7 @@ if __name__ == "__main__":
     run_tests()
 '''
 
-    def _generate_api_docs(self) -> str:
-        """Generate API documentation."""
-        return f'''# {self.project_name} API Documentation
+_API_DOCS_TPL = Template('''# $project_name API Documentation
 
 ## Overview
 This document describes the API and structure of the Basic ESP32 project.
@@ -482,8 +483,9 @@ Main application entry point and control logic.
 #### Functions
 - `setup()` - Initialize hardware and configuration
 - `toggle_led()` - Toggle LED state
-- `check_button()` - Check button state with debouncing
-- `main_loop()` - Main application loop
+- `debounce_elapsed(now, last, window)` - Viper-compiled debounce check on raw tick values
+- `check_button(pin)` - Button IRQ handler with debouncing
+- `main_loop()` - Idle loop; button IRQ and blink timer drive the LED
 - `main()` - Application entry point
 
 ### config.py
@@ -511,6 +513,13 @@ Utility functions and helper classes.
 - `SimpleTimer(interval_ms)` - Simple timer for periodic tasks
 - `MovingAverage(window_size)` - Moving average calculator
 
+### pin_caps.py
+Pin capability bitmaps (`IN_ONLY`, `ADC`, `DAC`, `BOOTSTRAP`, `FLASH`, `UART0`), one bit per GPIO.
+
+#### Functions
+- `has_cap(pin, cap)` - Test a pin against a capability table
+- `is_output_capable(pin)` - Check a pin can drive an output
+
 ## Hardware Configuration
 
 ### Default Pins
@@ -556,11 +565,9 @@ Run tests with:
 ```bash
 python -m unittest tests.test_main
 ```
-'''
+''')
 
-    def _generate_pinout(self) -> str:
-        """Generate pinout reference."""
-        return '''ESP32 Basic Project - Pin Reference
+_PINOUT_TXT = '''ESP32 Basic Project - Pin Reference
 
 Default Pin Configuration:
 ========================
@@ -608,4 +615,105 @@ Recommended for beginners:
 - GPIO4, 5, 16, 17, 18, 19, 21, 22, 23 are safe choices
 - Use GPIO32, 33 for analog input (ADC)
 - Use GPIO25, 26 for analog output (DAC)
-'''
\ No newline at end of file
+'''
+
+_PIN_CAPS_PY = '''\"\"\"
+ESP32 pin capability tables
+One bit per GPIO 0..39, packed little-endian into 5 bytes
+\"\"\"
+
+IN_ONLY = b'\\x00\\x00\\x00\\x00\\x9c'    # GPIO34-36, 39
+ADC = b'\\x00\\x00\\x00\\x00\\x9f'        # ADC1: GPIO32-36, 39
+DAC = b'\\x00\\x00\\x00\\x06\\x00'        # GPIO25, 26
+BOOTSTRAP = b'\\x05\\x90\\x00\\x00\\x00'  # GPIO0, 2, 12, 15
+FLASH = b'\\xc0\\x0f\\x00\\x00\\x00'      # GPIO6-11, reserved for SPI flash
+UART0 = b'\\x0a\\x00\\x00\\x00\\x00'      # GPIO1 (TX), 3 (RX)
+
+def has_cap(pin, cap):
+    \"\"\"Return True if `pin` has capability `cap` (one of the tables above).\"\"\"
+    return 0 <= pin < 40 and bool(cap[pin >> 3] & (1 << (pin & 7)))
+
+def is_output_capable(pin):
+    \"\"\"Return True if `pin` can be used as a general purpose output.\"\"\"
+    return 0 <= pin < 40 and not (has_cap(pin, IN_ONLY) or has_cap(pin, FLASH))
+'''
+
+
+class BasicTemplate(BaseTemplate):
+    """Basic ESP32 project template with minimal functionality."""
+
+    __slots__ = ()
+
+    description = "Basic ESP32 project with LED control and basic I/O"
+    author = "ESP32Manager"
+    version = "1.0.0"
+    features = [
+        "Built-in LED control",
+        "GPIO pin management",
+        "Basic timer functionality",
+        "Serial communication",
+        "Error handling"
+    ]
+    dependencies = []
+
+    def generate_files(self) -> dict[str, str]:
+        """Generate all project files."""
+        return {
+            **self.get_common_files(),
+            # Template-specific files
+            **self._static_files(),
+            'docs/API.md': self._generate_api_docs(),
+        }
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _static_files(cls) -> Mapping[str, str]:
+        """Project-independent files, rendered once per template class."""
+        files = {
+            'src/main.py': cls._generate_main(),
+            'src/config.py': cls._generate_config(),
+            'src/utils.py': cls._generate_utils(),
+            'tests/test_main.py': cls._generate_tests(),
+            'src/pin_caps.py': cls._generate_pin_caps(),
+            'assets/pinout.txt': cls._generate_pinout(),
+        }
+        return MappingProxyType({sys.intern(path): content for path, content in files.items()})
+
+    @staticmethod
+    def _get_usage_instructions() -> str:
+        """Get basic template usage instructions."""
+        return _USAGE_INSTRUCTIONS
+
+    @staticmethod
+    def _generate_main() -> str:
+        """Generate main.py file."""
+        return _MAIN_PY
+
+    @staticmethod
+    def _generate_config() -> str:
+        """Generate config.py file."""
+        return _CONFIG_PY
+
+    @staticmethod
+    def _generate_utils() -> str:
+        """Generate utils.py file."""
+        return _UTILS_PY
+
+    @staticmethod
+    def _generate_tests() -> str:
+        """Generate test file."""
+        return _TEST_MAIN_PY
+
+    def _generate_api_docs(self) -> str:
+        """Generate API documentation."""
+        return _API_DOCS_TPL.substitute(project_name=self.project_name)
+
+    @staticmethod
+    def _generate_pinout() -> str:
+        """Generate pinout reference."""
+        return _PINOUT_TXT
+
+    @staticmethod
+    def _generate_pin_caps() -> str:
+        """Generate pin capability lookup tables."""
+        return _PIN_CAPS_PY
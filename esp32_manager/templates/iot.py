@@ -1,66 +1,25 @@
-from typing import Dict
-from . import BaseTemplate
+from __future__ import annotations
 
-class IoTTemplate(BaseTemplate):
-    """IoT project template with Wi-Fi, MQTT, sensors, and web server."""
+import functools
+import gzip
+import re
+import sys
+from collections.abc import Mapping
+from string import Template
+from types import MappingProxyType
+from esp32_manager.templates.base import BaseTemplate
 
-    description = (
-        "Complete IoT solution with WiFi connectivity, MQTT communication, sensor readings, and web interface"
-    )
-    author = "ESP32Manager"
-    version = "1.0.0"
-    features = [
-        "WiFi connection management",
-        "MQTT client with auto-reconnect",
-        "Sensor data collection",
-        "Web server with REST API",
-        "Configuration management",
-        "OTA updates support",
-        "Data logging to SD card",
-        "Real-time dashboard",
-    ]
-    dependencies = [
-        "umqtt.simple",
-        "upip",
-        "ujson",
-    ]
+# Static file bodies, built once at import time
+_USAGE_INSTRUCTIONS = """1. Configure WiFi credentials in config.py
+2. Set up MQTT broker details
+3. Configure sensors in sensor_manager.py
+4. Access web interface at http://<esp32-ip>
+5. Subscribe to <prefix>/batch for sensor data and status (one JSON object per interval;
+   batches over MQTT_COMPRESS_THRESHOLD bytes arrive zlib-compressed on <prefix>/batch/z)
+6. Publish to <prefix>/control/led (payload on/off), /restart or /status to control the device
+7. Use REST API for remote control"""
 
-    def generate_files(self) -> Dict[str, str]:
-        """Generate all IoT project files."""
-        files = self.get_common_files()
-        files.update({
-            'src/main.py': self._generate_main(),
-            'src/config.py': self._generate_config(),
-            'src/wifi_manager.py': self._generate_wifi_manager(),
-            'src/mqtt_client.py': self._generate_mqtt_client(),
-            'src/sensor_manager.py': self._generate_sensor_manager(),
-            'src/web_server.py': self._generate_web_server(),
-            'src/data_logger.py': self._generate_data_logger(),
-            'src/utils.py': self._generate_utils(),
-            'tests/test_iot.py': self._generate_tests(),
-            'docs/API.md': self._generate_api_docs(),
-            'assets/web/index.html': self._generate_web_interface(),
-            'assets/web/styles.css': self._generate_web_styles(),
-            'assets/web/scripts.js': self._generate_web_scripts(),
-            'assets/config.json': self._generate_default_config(),
-        })
-        return files
-
-    def _get_usage_instructions(self) -> str:
-        """Get IoT template usage instructions."""
-        return (
-            "1. Configure WiFi credentials in config.py\n"
-            "2. Set up MQTT broker details\n"
-            "3. Configure sensors in sensor_manager.py\n"
-            "4. Access web interface at http://<esp32-ip>\n"
-            "5. Monitor MQTT topics for sensor data\n"
-            "6. Use REST API for remote control"
-        )
-
-    @staticmethod
-    def _generate_main() -> str:
-        """Generate IoT main.py file."""
-        return '''"""
+_MAIN_PY = '''"""
 ESP32 IoT Project - Main Application
 ===================================
 Complete IoT solution with WiFi, MQTT, sensors, and web interface
@@ -69,13 +28,32 @@ Complete IoT solution with WiFi, MQTT, sensors, and web interface
 import time
 import gc
 import machine
+import ujson
+import uasyncio as asyncio
+# [mqtt]
+from uasyncio import core
+# [/mqtt]
 from config import Config
 from wifi_manager import WiFiManager
-from mqtt_client import MQTTClient
 from sensor_manager import SensorManager
+# [mqtt]
+from mqtt_client import MQTTClient
+# [/mqtt]
+# [web_server]
 from web_server import WebServer
+# [/web_server]
+# [data_logging]
 from data_logger import DataLogger
+# [/data_logging]
 from utils import logger, handle_error, system_info
+# [mqtt]
+
+import io
+try:
+    import deflate
+except ImportError:  # Firmware built without deflate support
+    deflate = None
+# [/mqtt]
 
 # Global objects
 wifi = None
@@ -84,6 +62,15 @@ sensors = None
 web_server = None
 data_logger = None
 
+# Latest sensor readings, shared between tasks
+sensor_data = {}
+
+# How often the WiFi state machine is advanced
+WIFI_TICK_MS = 250
+
+# Hardware timer that paces sensor sampling
+SENSOR_TIMER_ID = 0
+
 # Status LED
 status_led = machine.Pin(Config.STATUS_LED_PIN, machine.Pin.OUT)
 
@@ -99,6 +86,10 @@ def setup():
     logger(f"Free memory: {info['free_memory']} bytes")
     logger(f"CPU frequency: {info['freq']} Hz")
 
+    # Let the allocator collect on its own once another quarter of the
+    # free heap has been allocated, instead of on a fixed timer
+    gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
     try:
         # Initialize WiFi
         logger("Initializing WiFi...")
@@ -108,30 +99,36 @@ def setup():
         logger("Initializing sensors...")
         sensors = SensorManager()
 
+        # [data_logging]
         # Initialize data logger
-        if Config.ENABLE_DATA_LOGGING:
-            logger("Initializing data logger...")
-            data_logger = DataLogger()
+        logger("Initializing data logger...")
+        data_logger = DataLogger()
 
+        # [/data_logging]
         # Connect to WiFi
         if wifi.connect():
             logger("WiFi connected successfully")
+            # [mqtt]
 
             # Initialize MQTT
-            if Config.ENABLE_MQTT:
-                logger("Initializing MQTT...")
-                mqtt = MQTTClient(wifi.get_ip())
-                if mqtt.connect():
-                    logger("MQTT connected successfully")
-                else:
-                    logger("MQTT connection failed", "WARNING")
+            logger("Initializing MQTT...")
+            mqtt = MQTTClient(wifi.get_ip())
+            mqtt.on_control("led", control_led)
+            mqtt.on_control("restart", lambda msg: machine.reset())
+            mqtt.on_control("status", publish_status)
+            if mqtt.connect():
+                logger("MQTT connected successfully")
+            else:
+                logger("MQTT connection failed", "WARNING")
+            # [/mqtt]
+            # [web_server]
 
             # Initialize web server
-            if Config.ENABLE_WEB_SERVER:
-                logger("Starting web server...")
-                web_server = WebServer(sensors, mqtt, data_logger)
-                web_server.start()
-                logger(f"Web server started at http://{wifi.get_ip()}")
+            logger("Starting web server...")
+            web_server = WebServer(sensors, mqtt, data_logger)
+            web_server.start()
+            logger(f"Web server will serve http://{wifi.get_ip()}")
+            # [/web_server]
         else:
             logger("WiFi connection failed", "ERROR")
             # Continue in offline mode
@@ -146,90 +143,256 @@ def setup():
         raise
 
 
-def main_loop():
-    """Main application loop."""
-    logger("Entering main loop...")
+# [mqtt]
+def control_led(msg):
+    """Switch the status LED from an MQTT command ("on" or "off")."""
+    status_led.value(msg == b"on")
+
+
+# Encoded once; the MQTT client takes bytes topics
+STATUS_TOPIC = (Config.MQTT_TOPIC_PREFIX + "/status").encode()
+
+
+def publish_status(msg):
+    """Answer a status request on <prefix>/status."""
+    mqtt.publish_telemetry(
+        STATUS_TOPIC,
+        ujson.dumps({"uptime": time.time() - Config.START_TIME, "free_memory": gc.mem_free()}),
+    )
+
+
+# [/mqtt]
+async def wait_next(deadline, interval):
+    """Sleep until one interval past a ticks_ms() deadline and return the new deadline.
+
+    Keeps a fixed period however long the task's work took; missed periods
+    are skipped rather than run back to back.
+    """
+    deadline = time.ticks_add(deadline, interval)
+    delay = time.ticks_diff(deadline, time.ticks_ms())
+    if delay < 0:
+        deadline, delay = time.ticks_ms(), 0
+    await asyncio.sleep_ms(delay)
+    return deadline
+
 
-    last_sensor_read = time.time()
-    last_mqtt_publish = time.time()
-    last_gc_collect = time.time()
-    last_status_check = time.time()
+async def sensor_task():
+    """Read sensors into the shared sensor_data dict on a hardware timer.
 
-    sensor_data = {}
+    The timer keeps the sampling period exact even while other tasks hold
+    the scheduler; its callback only sets a flag the task waits on.
+    """
+    sample_due = asyncio.ThreadSafeFlag()
+    timer = machine.Timer(SENSOR_TIMER_ID)
+    timer.init(period=Config.SENSOR_READ_INTERVAL_MS, mode=machine.Timer.PERIODIC,
+               callback=lambda t: sample_due.set())
+
+    # Bind loop invariants to locals: attribute loads are dict lookups
+    log_data = data_logger.log_data if data_logger else None
+    read_all = sensors.read_all
+    debug = Config.DEBUG_LOGGING
 
     try:
         while True:
-            current_time = time.time()
+            try:
+                read_all(sensor_data)
+                # Only serialise the readings when they will actually be logged
+                if debug:
+                    logger("Sensor data: " + ujson.dumps(sensor_data), "DEBUG")
 
-            # Read sensors periodically
-            if current_time - last_sensor_read >= Config.SENSOR_READ_INTERVAL:
-                try:
-                    sensor_data = sensors.read_all()
-                    logger(f"Sensor data: {sensor_data}", "DEBUG")
-                    last_sensor_read = current_time
-
-                    # Log data if enabled
-                    if data_logger and Config.ENABLE_DATA_LOGGING:
-                        data_logger.log_data(sensor_data)
-                except Exception as e:
-                    handle_error("Sensor reading failed", e)
-
-            # Publish to MQTT periodically
-            if mqtt and mqtt.is_connected() and current_time - last_mqtt_publish >= Config.MQTT_PUBLISH_INTERVAL:
-                try:
-                    for sensor_name, value in sensor_data.items():
-                        topic = f"{Config.MQTT_TOPIC_PREFIX}/{sensor_name}"
-                        mqtt.publish(topic, str(value))
-
-                    # Publish system status
-                    status_topic = f"{Config.MQTT_TOPIC_PREFIX}/status"
-                    status_data = {
-                        "uptime": current_time - Config.START_TIME,
-                        "free_memory": gc.mem_free(),
-                        "wifi_rssi": wifi.get_rssi() if wifi else 0
-                    }
-                    mqtt.publish(status_topic, str(status_data))
-                    last_mqtt_publish = current_time
-                except Exception as e:
-                    handle_error("MQTT publish failed", e)
+                # Log data if enabled
+                if log_data:
+                    log_data(sensor_data)
+            except Exception as e:
+                handle_error("Sensor reading failed", e)
+
+            await sample_due.wait()
+    finally:
+        timer.deinit()
+
+
+# [mqtt]
+def compress_payload(data):
+    """Compress bytes into a zlib stream; None if this firmware cannot compress."""
+    global deflate
+    if deflate is None:
+        return None
+    buf = io.BytesIO()
+    try:
+        with deflate.DeflateIO(buf, deflate.ZLIB) as stream:
+            stream.write(data)
+    except Exception as e:
+        # Many builds ship deflate with decompression only
+        # (MICROPY_PY_DEFLATE_COMPRESS off); stop trying after the first failure
+        handle_error("Compression unavailable, publishing uncompressed", e)
+        deflate = None
+        return None
+    return buf.getvalue()
+
+
+async def mqtt_task():
+    """Publish the latest readings to MQTT periodically, all in one message."""
+    # Encoded once; umqtt writes bytes topics to the socket as they are
+    batch_topic = f"{Config.MQTT_TOPIC_PREFIX}/batch".encode()
+    compressed_topic = batch_topic + b"/z"
+    interval = Config.MQTT_PUBLISH_INTERVAL_MS
+    deadline = time.ticks_ms()
+    threshold = Config.MQTT_COMPRESS_THRESHOLD
+    start_time = Config.START_TIME
+
+    # Reused for every publish instead of allocating fresh dicts each time
+    status_data = {"uptime": 0, "free_memory": 0, "wifi_rssi": 0}
+    message = {"sensors": sensor_data, "status": status_data}
+
+    while True:
+        deadline = await wait_next(deadline, interval)
+        if mqtt and mqtt.is_connected():
+            try:
+                status_data["uptime"] = time.time() - start_time
+                status_data["free_memory"] = gc.mem_free()
+                status_data["wifi_rssi"] = wifi.get_rssi() if wifi else 0
+                payload = ujson.dumps(message)
+                topic = batch_topic
+
+                # Large batches go out zlib-compressed on <prefix>/batch/z,
+                # or uncompressed on <prefix>/batch if compression fails
+                if deflate and len(payload) >= threshold:
+                    compressed = compress_payload(payload.encode())
+                    if compressed is not None:
+                        payload = compressed
+                        topic = compressed_topic
+
+                mqtt.publish_telemetry(topic, payload)
+            except Exception as e:
+                handle_error("MQTT publish failed", e)
+
+
+# [/mqtt]
+async def wifi_task():
+    """Drive the WiFi state machine; reconnects happen here without blocking."""
+    while True:
+        try:
+            wifi.tick()
+        except Exception as e:
+            handle_error("WiFi state machine failed", e)
+        await asyncio.sleep_ms(WIFI_TICK_MS)
+
+
+# [mqtt]
+async def status_task():
+    """Check connections and reconnect when needed."""
+    interval = Config.STATUS_CHECK_INTERVAL_MS
+    deadline = time.ticks_ms()
+
+    while True:
+        deadline = await wait_next(deadline, interval)
+        try:
+            if mqtt and wifi.is_connected() and not mqtt.is_connected():
+                logger("MQTT disconnected, attempting reconnection...", "WARNING")
+                mqtt.reconnect()
+        except Exception as e:
+            handle_error("Status check failed", e)
 
-            # Connection checks
-            if current_time - last_status_check >= Config.STATUS_CHECK_INTERVAL:
-                try:
-                    if wifi and not wifi.is_connected():
-                        logger("WiFi disconnected, attempting reconnection...", "WARNING")
-                        wifi.reconnect()
-                    if mqtt and not mqtt.is_connected():
-                        logger("MQTT disconnected, attempting reconnection...", "WARNING")
-                        mqtt.reconnect()
-                    last_status_check = current_time
-                except Exception as e:
-                    handle_error("Status check failed", e)
-
-            # Handle web and MQTT
-            if web_server:
-                try:
-                    web_server.handle_requests()
-                except Exception as e:
-                    handle_error("Web server error", e)
-            if mqtt and mqtt.is_connected():
-                try:
-                    mqtt.check_messages()
-                except Exception as e:
-                    handle_error("MQTT message handling failed", e)
 
-            # Garbage collection
-            if current_time - last_gc_collect >= Config.GC_INTERVAL:
-                gc.collect()
-                last_gc_collect = current_time
+def wait_readable(sock):
+    """Suspend until sock is readable (or closed); the event loop's poller wakes us."""
+    yield core._io_queue.queue_read(sock)
 
-            time.sleep_ms(Config.MAIN_LOOP_DELAY)
 
+async def mqtt_rx_task():
+    """Handle inbound MQTT messages as soon as the socket has data."""
+    delay = Config.MAIN_LOOP_DELAY
+    sleep_ms = asyncio.sleep_ms
+
+    while True:
+        if not (mqtt and mqtt.is_connected()):
+            await sleep_ms(delay)
+            continue
+
+        # Reconnecting closes the old socket, which also wakes this wait
+        await wait_readable(mqtt.sock)
+        try:
+            handled = mqtt.check_messages()
+        except Exception as e:
+            handle_error("MQTT message handling failed", e)
+            handled = True
+        if not handled:
+            # The sender holds the socket; let it finish before reading
+            await sleep_ms(delay)
+
+
+async def mqtt_delivery_task():
+    """Run delivery callbacks and control handlers queued by the MQTT client."""
+    delay = Config.MAIN_LOOP_DELAY
+
+    while True:
+        if mqtt is None:
+            await asyncio.sleep_ms(delay)
+            continue
+        await mqtt.pending.wait()
+        mqtt.run_callbacks()
+
+
+# [/mqtt]
+# [data_logging]
+async def data_log_task():
+    """Write buffered readings to storage periodically."""
+    interval = Config.DATA_LOG_FLUSH_INTERVAL_MS
+    deadline = time.ticks_ms()
+
+    while True:
+        deadline = await wait_next(deadline, interval)
+        data_logger.flush()
+
+
+# [/data_logging]
+async def gc_task():
+    """Collect garbage when free memory runs low.
+
+    gc.threshold() set in setup() covers bursts of allocation between
+    checks; a full collection is still forced every GC_FORCE_INTERVAL_MS.
+    """
+    interval = Config.GC_INTERVAL_MS
+    force_interval = Config.GC_FORCE_INTERVAL_MS
+    min_free = Config.GC_MIN_FREE
+    mem_free = gc.mem_free
+    ticks_diff = time.ticks_diff
+    deadline = last_collect = time.ticks_ms()
+
+    while True:
+        deadline = await wait_next(deadline, interval)
+        if mem_free() < min_free or ticks_diff(deadline, last_collect) >= force_interval:
+            gc.collect()
+            last_collect = deadline
+
+
+async def main_async():
+    """Run all application tasks concurrently."""
+    task_funcs = [wifi_task, sensor_task, gc_task]
+    # [mqtt]
+    task_funcs += [mqtt_task, status_task, mqtt_rx_task, mqtt_delivery_task]
+    # [/mqtt]
+    # [data_logging]
+    task_funcs.append(data_log_task)
+    # [/data_logging]
+
+    tasks = [asyncio.create_task(task()) for task in task_funcs]
+    await asyncio.gather(*tasks)
+
+
+def main_loop():
+    """Main application loop."""
+    logger("Entering main loop...")
+
+    try:
+        asyncio.run(main_async())
     except KeyboardInterrupt:
         logger("Program interrupted by user")
     except Exception as e:
         handle_error("Main loop error", e)
     finally:
+        # Reset scheduler state so the loop can be restarted from the REPL
+        asyncio.new_event_loop()
         cleanup()
 
 
@@ -266,26 +429,1350 @@ if __name__ == "__main__":
 '''
 
 
-    def _generate_data_logger(self) -> bool:
+_CONFIG_PY = '''"""
+ESP32 IoT Project Configuration
+Modify these settings to customize behavior
+
+Integer settings are declared as private const() values, which the
+compiler folds into this module instead of storing them as globals
+"""
+
+import time
+from micropython import const
+
+# Hardware Configuration
+_STATUS_LED_PIN = const(2)       # Built-in LED pin (GPIO2 on most ESP32 boards)
+_DHT_PIN = const(4)              # DHT22 temperature/humidity data pin
+_LDR_PIN = const(34)             # Light sensor, ADC1 input
+_PIR_PIN = const(27)             # Motion sensor output
+_DS18B20_PIN = const(5)          # OneWire bus for DS18B20 temperature probes
+_SENSOR_CACHE_MS = const(2000)   # Reuse readings this fresh instead of re-reading
+
+# Timing Configuration (milliseconds)
+_SENSOR_READ_INTERVAL_MS = const(5000)
+_MQTT_PUBLISH_INTERVAL_MS = const(10000)
+_STATUS_CHECK_INTERVAL_MS = const(30000)
+_DATA_LOG_FLUSH_INTERVAL_MS = const(60000)
+_GC_INTERVAL_MS = const(5000)            # How often free memory is checked
+_GC_FORCE_INTERVAL_MS = const(600000)    # Longest gap between full collections
+_MAIN_LOOP_DELAY = const(50)             # MQTT receive retry delay while offline/busy
+
+# WiFi Configuration
+_WIFI_CONNECT_TIMEOUT_MS = const(15000)
+_WIFI_RETRY_MIN_MS = const(1000)
+_WIFI_RETRY_MAX_MS = const(60000)
+
+# MQTT Configuration
+_MQTT_PORT = const(1883)
+_MQTT_KEEPALIVE = const(60)              # Seconds
+_MQTT_QUEUE_SIZE = const(16)
+_MQTT_COMPRESS_THRESHOLD = const(512)    # Bytes; larger batches are deflated
+
+# Web Server Configuration
+_WEB_SERVER_PORT = const(80)
+
+# Data Logging Configuration
+_DATA_LOG_BUFFER = const(64)             # Readings held in RAM between flushes
+
+# Memory Configuration
+_GC_MIN_FREE = const(20000)              # Collect when free heap drops below this
+
+class Config:
+    """Project configuration constants."""
+
+    STATUS_LED_PIN = _STATUS_LED_PIN
+    DHT_PIN = _DHT_PIN
+    LDR_PIN = _LDR_PIN
+    PIR_PIN = _PIR_PIN
+    DS18B20_PIN = _DS18B20_PIN
+    SENSOR_CACHE_MS = _SENSOR_CACHE_MS
+
+    SENSOR_READ_INTERVAL_MS = _SENSOR_READ_INTERVAL_MS
+    MQTT_PUBLISH_INTERVAL_MS = _MQTT_PUBLISH_INTERVAL_MS
+    STATUS_CHECK_INTERVAL_MS = _STATUS_CHECK_INTERVAL_MS
+    DATA_LOG_FLUSH_INTERVAL_MS = _DATA_LOG_FLUSH_INTERVAL_MS
+    GC_INTERVAL_MS = _GC_INTERVAL_MS
+    GC_FORCE_INTERVAL_MS = _GC_FORCE_INTERVAL_MS
+    MAIN_LOOP_DELAY = _MAIN_LOOP_DELAY
+
+    # WiFi Configuration
+    WIFI_SSID = "your_wifi_ssid"
+    WIFI_PASSWORD = "your_wifi_password"
+    WIFI_CONNECT_TIMEOUT_MS = _WIFI_CONNECT_TIMEOUT_MS
+    WIFI_RETRY_MIN_MS = _WIFI_RETRY_MIN_MS
+    WIFI_RETRY_MAX_MS = _WIFI_RETRY_MAX_MS
+    WIFI_FAST_RECONNECT = True   # Reuse the last DHCP lease on reconnect
+
+    # MQTT Configuration
+    MQTT_BROKER = "192.168.1.100"
+    MQTT_PORT = _MQTT_PORT
+    MQTT_CLIENT_ID = ""          # Empty: derived from the chip's unique id
+    MQTT_USER = ""
+    MQTT_PASSWORD = ""
+    MQTT_KEEPALIVE = _MQTT_KEEPALIVE
+    MQTT_TOPIC_PREFIX = "esp32"
+    MQTT_QUEUE_SIZE = _MQTT_QUEUE_SIZE
+    MQTT_COMPRESS_THRESHOLD = _MQTT_COMPRESS_THRESHOLD
+
+    # Web Server Configuration
+    WEB_SERVER_PORT = _WEB_SERVER_PORT
+
+    # Data Logging Configuration
+    DATA_LOG_FILE = "/sd/sensor_data.log"
+    DATA_LOG_BUFFER = _DATA_LOG_BUFFER
+    ENABLE_BINARY_LOG = False
+    DATA_LOG_FIELDS = ()         # Reading names packed into binary records
+
+    # Memory Configuration
+    GC_MIN_FREE = _GC_MIN_FREE
+
+    # Feature Flags
+    DEBUG_LOGGING = False
+
+    # Project Information
+    PROJECT_NAME = "ESP32 IoT Project"
+    VERSION = "1.0.0"
+    START_TIME = time.time()
+'''
+
+
+_WIFI_MANAGER_PY = '''"""
+WiFi connection manager
+Non-blocking state machine: tick() advances at most one step and returns
+"""
+
+import os
+import time
+import network
+import ujson
+from config import Config
+from utils import logger, handle_error
+
+# Last DHCP lease, reused on reconnect (also across power cycles)
+LEASE_FILE = "/wifi_lease.json"
+# Typical router lease time; older leases are not reused
+LEASE_MAX_AGE_S = 86400
+
+STATE_IDLE = 0
+STATE_CONNECTING = 1
+STATE_READY = 2
+STATE_RETRY_BACKOFF = 3
+
+class WiFiManager:
+    """Station-mode WiFi connection with exponential reconnect backoff."""
+
+    def __init__(self):
+        self.wlan = network.WLAN(network.STA_IF)
+        self.wlan.active(True)
+        self.state = STATE_IDLE
+        self.deadline = 0
+        self.backoff = Config.WIFI_RETRY_MIN_MS
+        self.lease = self._load_lease() if Config.WIFI_FAST_RECONNECT else None
+        self.using_lease = False
+
+    def tick(self, now=None):
+        """Advance the connection state machine; never blocks."""
+        if now is None:
+            now = time.ticks_ms()
+
+        if self.state == STATE_IDLE:
+            logger(f"Connecting to WiFi '{Config.WIFI_SSID}'...")
+            # A known lease skips the DHCP exchange; otherwise ask for one
+            self.using_lease = self.lease is not None
+            self.wlan.ifconfig(self.lease or 'dhcp')
+            self.wlan.connect(Config.WIFI_SSID, Config.WIFI_PASSWORD)
+            self.deadline = time.ticks_add(now, Config.WIFI_CONNECT_TIMEOUT_MS)
+            self.state = STATE_CONNECTING
+
+        elif self.state == STATE_CONNECTING:
+            # isconnected() only turns True once DHCP has assigned an address
+            if self.wlan.isconnected():
+                logger(f"WiFi connected, IP: {self.get_ip()}")
+                self.backoff = Config.WIFI_RETRY_MIN_MS
+                self.state = STATE_READY
+                if Config.WIFI_FAST_RECONNECT and self.lease is None:
+                    self._save_lease(self.wlan.ifconfig())
+            elif time.ticks_diff(now, self.deadline) >= 0 and self.using_lease:
+                # The address may have been reassigned: retry at once with DHCP
+                logger("WiFi connection with cached lease failed, using DHCP", "WARNING")
+                self._forget_lease()
+                self.wlan.disconnect()
+                self.state = STATE_IDLE
+            elif time.ticks_diff(now, self.deadline) >= 0:
+                logger(f"WiFi connection timed out, retrying in {self.backoff} ms", "WARNING")
+                self.wlan.disconnect()
+                self.deadline = time.ticks_add(now, self.backoff)
+                self.backoff = min(self.backoff * 2, Config.WIFI_RETRY_MAX_MS)
+                self.state = STATE_RETRY_BACKOFF
+
+        elif self.state == STATE_READY:
+            if not self.wlan.isconnected():
+                logger("WiFi connection lost", "WARNING")
+                self.state = STATE_IDLE
+
+        elif self.state == STATE_RETRY_BACKOFF:
+            if time.ticks_diff(now, self.deadline) >= 0:
+                self.state = STATE_IDLE
+
+        return self.state == STATE_READY
+
+    def connect(self, timeout_ms=None):
+        """Connect, blocking for up to timeout_ms. Intended for startup only."""
+        if timeout_ms is None:
+            timeout_ms = Config.WIFI_CONNECT_TIMEOUT_MS
+        start = time.ticks_ms()
+        while not self.tick():
+            if time.ticks_diff(time.ticks_ms(), start) >= timeout_ms:
+                return False
+            time.sleep_ms(100)
+        return True
+
+    def reconnect(self):
+        """Restart the connection sequence on the next tick."""
+        self.wlan.disconnect()
+        self.state = STATE_IDLE
+
+    def disconnect(self):
+        """Disconnect and stop reconnecting."""
+        self.wlan.disconnect()
+        self.wlan.active(False)
+        self.state = STATE_IDLE
+
+    def is_connected(self):
+        """Return True if connected with an IP address.
+
+        Reads the state machine rather than the driver; tick() refreshes it.
+        """
+        return self.state == STATE_READY
+
+    def get_ip(self):
+        """Return the station IP address."""
+        return self.wlan.ifconfig()[0]
+
+    def get_rssi(self):
+        """Return the signal strength of the current access point in dBm."""
+        return self.wlan.status('rssi')
+
+    def _load_lease(self):
+        """Read the cached (ip, netmask, gateway, dns) lease, if still usable.
+
+        A lease is only reused on the network it came from and while it is
+        younger than LEASE_MAX_AGE_S; a clock that went backwards (RTC reset
+        by a power cycle) also counts as expired.
+        """
+        try:
+            with open(LEASE_FILE) as f:
+                record = ujson.load(f)
+            if record["ssid"] != Config.WIFI_SSID:
+                return None
+            if not 0 <= time.time() - record["saved"] < LEASE_MAX_AGE_S:
+                return None
+            return tuple(record["ifconfig"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_lease(self, lease):
+        """Cache the lease handed out by DHCP with the network it belongs to.
+
+        The lease itself carries the gateway, so the SSID and time it was
+        handed out are all that need storing alongside it.
+        """
+        self.lease = tuple(lease)
+        record = {
+            "ssid": Config.WIFI_SSID,
+            "saved": time.time(),
+            "ifconfig": list(lease),
+        }
+        try:
+            with open(LEASE_FILE, "w") as f:
+                ujson.dump(record, f)
+        except OSError as e:
+            handle_error("Saving WiFi lease failed", e)
+
+    def _forget_lease(self):
+        """Drop the cached lease."""
+        if self.lease is None:
+            return
+        self.lease = None
+        try:
+            os.remove(LEASE_FILE)
+        except OSError:
+            pass
+'''
+
+
+_MQTT_CLIENT_PY = '''"""
+MQTT client wrapper
+publish() only enqueues; a background thread does the network writes so a
+slow broker or link never stalls the main application
+"""
+
+import time
+import _thread
+import machine
+import uasyncio as asyncio
+import ubinascii
+from collections import deque
+from umqtt.simple import MQTTClient as UMQTTClient
+from config import Config
+from utils import logger, handle_error
+
+# Sender thread poll interval while the queue is empty
+SENDER_IDLE_MS = 20
+
+class MQTTClient:
+    """umqtt.simple client with a bounded, drop-oldest publish queue."""
+
+    def __init__(self, client_ip=None):
+        client_id = Config.MQTT_CLIENT_ID or ubinascii.hexlify(machine.unique_id()).decode()
+        self.client = UMQTTClient(
+            client_id,
+            Config.MQTT_BROKER,
+            port=Config.MQTT_PORT,
+            user=Config.MQTT_USER or None,
+            password=Config.MQTT_PASSWORD or None,
+            keepalive=Config.MQTT_KEEPALIVE,
+        )
+        self.client.set_callback(self._on_message)
+        self.control_prefix = (Config.MQTT_TOPIC_PREFIX + "/control/").encode()
+        # Command name (last topic segment, bytes) -> handler(payload)
+        self.control_handlers = {}
+
+        # A full deque discards its oldest entry on append
+        self.queue = deque((), Config.MQTT_QUEUE_SIZE)
+        # Acknowledged QoS 1 messages waiting for their callback to run
+        self.confirmed = deque((), Config.MQTT_QUEUE_SIZE)
+        # Inbound (topic, msg) pairs waiting for their control handler.
+        # umqtt delivers these on whichever thread reads the socket, which
+        # is the sender thread while it waits for a PUBACK
+        self.inbound = deque((), Config.MQTT_QUEUE_SIZE)
+        # Set when `confirmed` or `inbound` gains an entry
+        self.pending = asyncio.ThreadSafeFlag()
+        self.lock = _thread.allocate_lock()
+        self.connected = False
+        self.sender_running = False
+
+    @property
+    def sock(self):
+        """Underlying socket, for waiting on inbound data."""
+        return self.client.sock
+
+    def connect(self):
+        """Connect to the broker and start the sender thread."""
+        try:
+            with self.lock:
+                self.client.connect()
+                self.client.subscribe(self.control_prefix + b"#")
+            self.connected = True
+            logger(f"MQTT connected to {Config.MQTT_BROKER}:{Config.MQTT_PORT}")
+        except OSError as e:
+            self.connected = False
+            handle_error("MQTT connect failed", e)
+            return False
+
+        if not self.sender_running:
+            self.sender_running = True
+            _thread.start_new_thread(self._sender, ())
+        return True
+
+    def reconnect(self):
+        """Drop the current connection and connect again."""
+        self._close_socket()
+        return self.connect()
+
+    def disconnect(self):
+        """Stop the sender thread and disconnect."""
+        self.sender_running = False
+        try:
+            with self.lock:
+                self.client.disconnect()
+        except OSError:
+            pass
+        self.connected = False
+
+    def is_connected(self):
+        """Return True while the broker connection is believed healthy."""
+        return self.connected
+
+    def publish(self, topic, payload, qos=0, callback=None):
+        """Queue a message for sending; never blocks on the network.
+
+        With qos=1 the sender thread waits for the broker's PUBACK, and
+        `callback(topic)` is then run from run_callbacks().
+        """
+        self.queue.append((topic, payload, qos, callback))
+
+    def publish_telemetry(self, topic, payload):
+        """Queue a fire-and-forget (QoS 0) message, e.g. sensor readings."""
+        self.queue.append((topic, payload, 0, None))
+
+    def publish_command(self, topic, payload, callback=None):
+        """Queue an acknowledged (QoS 1) message, e.g. control commands."""
+        self.queue.append((topic, payload, 1, callback))
+
+    def check_messages(self):
+        """Process pending inbound messages.
+
+        Returns False without reading when the sender holds the socket; the
+        data stays queued and the socket remains readable for the next try.
+        """
+        if not self.lock.acquire(0):
+            return False
+        try:
+            self.client.check_msg()
+        except OSError as e:
+            self.connected = False
+            handle_error("MQTT receive failed", e)
+        finally:
+            self.lock.release()
+        return True
+
+    def run_callbacks(self):
+        """Run queued delivery callbacks and control handlers.
+
+        Called from the event loop, so handlers never run on the sender thread.
+        """
+        while self.confirmed:
+            callback, topic = self.confirmed.popleft()
+            try:
+                callback(topic)
+            except Exception as e:
+                handle_error("MQTT delivery callback failed", e)
+
+        while self.inbound:
+            topic, msg = self.inbound.popleft()
+            handler = self.control_handlers.get(topic.rsplit(b"/", 1)[-1])
+            if not handler:
+                logger(f"Unhandled MQTT message on {topic.decode()}", "DEBUG")
+                continue
+            try:
+                handler(msg)
+            except Exception as e:
+                handle_error("MQTT control handler failed", e)
+
+    def on_control(self, command, handler):
+        """Call handler(payload) for messages on <prefix>/control/<command>."""
+        self.control_handlers[command.encode()] = handler
+
+    def _on_message(self, topic, msg):
+        """Queue a control message for run_callbacks(); may run on any thread."""
+        self.inbound.append((topic, msg))
+        self.pending.set()
+
+    def _sender(self):
+        """Background thread: drain the queue while connected."""
+        while self.sender_running:
+            if self.connected and self.queue:
+                topic, payload, qos, callback = self.queue.popleft()
+                try:
+                    # QoS 1 waits here for PUBACK, off the application's path
+                    with self.lock:
+                        self.client.publish(topic, payload, qos=qos)
+                    if callback:
+                        self.confirmed.append((callback, topic))
+                        self.pending.set()
+                except OSError as e:
+                    # The message is dropped; status checks will reconnect
+                    self.connected = False
+                    handle_error("MQTT publish failed", e)
+            else:
+                time.sleep_ms(SENDER_IDLE_MS)
+
+    def _close_socket(self):
+        """Close the socket without sending DISCONNECT."""
+        try:
+            with self.lock:
+                self.client.sock.close()
+        except (OSError, AttributeError):
+            pass
+        self.connected = False
+'''
+
+
+_WEB_SERVER_PY = '''"""
+Web server
+Connections are served by uasyncio.start_server, so a slow client waits on
+its own coroutine instead of stalling sensor sampling and MQTT
+"""
+
+import gc
+import time
+import ujson
+import uasyncio as asyncio
+from config import Config
+from utils import logger, handle_error
+
+WEB_ROOT = "/assets/web"
+CHUNK_SIZE = 512
+
+CONTENT_TYPES = {
+    "html": "text/html",
+    "css": "text/css",
+    "js": "application/javascript",
+    "json": "application/json",
+}
+
+class WebServer:
+    """Dashboard and REST API server."""
+
+    def __init__(self, sensors, mqtt=None, data_logger=None):
+        self.sensors = sensors
+        self.mqtt = mqtt
+        self.data_logger = data_logger
+        self.server = None
+
+    def start(self):
+        """Schedule the listener; it starts with the event loop."""
+        asyncio.create_task(self._serve())
+
+    def stop(self):
+        """Stop accepting connections."""
+        if self.server:
+            self.server.close()
+            self.server = None
+
+    async def _serve(self):
+        self.server = await asyncio.start_server(self._handle, "0.0.0.0", Config.WEB_SERVER_PORT)
+        logger(f"Web server listening on port {Config.WEB_SERVER_PORT}")
+
+    async def _handle(self, reader, writer):
+        """Serve one request; each connection runs in its own coroutine."""
+        try:
+            request = await reader.readline()
+            # Headers are not used, but must be read before responding
+            while (await reader.readline()) not in (b"\\r\\n", b""):
+                pass
+
+            parts = request.split()
+            if len(parts) < 2:
+                return
+            method, path = parts[0], parts[1].decode().split("?", 1)[0]
+
+            if method != b"GET":
+                await self._send_status(writer, "405 Method Not Allowed")
+            elif path == "/api/sensors":
+                await self._send_json(writer, self.sensors.read_all())
+            elif path == "/api/status":
+                await self._send_json(writer, self._status())
+            else:
+                await self._send_file(writer, "/index.html" if path == "/" else path)
+        except Exception as e:
+            handle_error("Web request failed", e)
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    def _status(self):
+        return {
+            "uptime": time.time() - Config.START_TIME,
+            "free_memory": gc.mem_free(),
+            "mqtt_connected": bool(self.mqtt and self.mqtt.is_connected()),
+        }
+
+    async def _send_json(self, writer, data):
+        body = ujson.dumps(data)
+        await writer.awrite(
+            f"HTTP/1.0 200 OK\\r\\nContent-Type: application/json\\r\\n"
+            f"Content-Length: {len(body)}\\r\\n\\r\\n{body}"
+        )
+
+    async def _send_status(self, writer, status):
+        await writer.awrite(f"HTTP/1.0 {status}\\r\\nContent-Length: 0\\r\\n\\r\\n")
+
+    async def _send_file(self, writer, path):
+        """Stream a web asset, preferring its pre-compressed copy."""
+        if ".." in path:
+            await self._send_status(writer, "400 Bad Request")
+            return
+
+        content_type = CONTENT_TYPES.get(path.rsplit(".", 1)[-1], "application/octet-stream")
+        encoding = ""
+        try:
+            f = open(WEB_ROOT + path + ".gz", "rb")
+            encoding = "Content-Encoding: gzip\\r\\n"
+        except OSError:
+            try:
+                f = open(WEB_ROOT + path, "rb")
+            except OSError:
+                await self._send_status(writer, "404 Not Found")
+                return
+
+        try:
+            await writer.awrite(
+                f"HTTP/1.0 200 OK\\r\\nContent-Type: {content_type}\\r\\n{encoding}\\r\\n"
+            )
+            buf = bytearray(CHUNK_SIZE)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                await writer.awrite(buf, 0, n)
+        finally:
+            f.close()
+'''
+
+
+_SENSOR_MANAGER_PY = '''"""
+Sensor manager
+Add or remove sensors in __init__; each reader stores its values into the
+shared readings dict
+"""
+
+import dht
+import ds18x20
+import machine
+import micropython
+import onewire
+import time
+from config import Config
+from utils import handle_error
+
+# Time a DS18B20 needs to convert at 12-bit resolution
+DS18B20_CONVERSION_MS = 750
+
+@micropython.viper
+def light_percent(raw: int) -> int:
+    """Scale a 12-bit ADC reading to 0-100."""
+    return raw * 100 // 4095
+
+class SensorManager:
+    """Reads all attached sensors into one dict."""
+
+    def __init__(self):
+        self.dht = dht.DHT22(machine.Pin(Config.DHT_PIN))
+        self.ldr = machine.ADC(machine.Pin(Config.LDR_PIN))
+        self.ldr.atten(machine.ADC.ATTN_11DB)
+        self.pir = machine.Pin(Config.PIR_PIN, machine.Pin.IN)
+        self.ds = ds18x20.DS18X20(onewire.OneWire(machine.Pin(Config.DS18B20_PIN)))
+        self.ds_roms = []
+        self.ds_started_ms = None
+        self.rescan_ds18b20()
+        self.readers = (
+            self._read_dht, self._read_ldr, self._read_pir, self._read_ds18b20,
+        )
+        # Readings younger than SENSOR_CACHE_MS are returned without
+        # touching the hardware; the DHT22 needs 2 s between measurements
+        self.last_readings = {}
+        self.last_read_ms = None
+
+    @micropython.native
+    def read_all(self, into=None):
+        """Read every sensor into `into` (cleared first) or a new dict.
+
+        Passing the same dict each time avoids allocating one per reading.
+        A sensor that fails is left out of the result. Calls within
+        Config.SENSOR_CACHE_MS of the last read get a copy of its readings.
+        """
+        data = {} if into is None else into
+        data.clear()
+        now = time.ticks_ms()
+        last_read = self.last_read_ms
+        if last_read is not None and time.ticks_diff(now, last_read) < Config.SENSOR_CACHE_MS:
+            data.update(self.last_readings)
+            return data
+
+        last = self.last_readings
+        last.clear()
+        for read in self.readers:
+            try:
+                read(last)
+            except OSError as e:
+                handle_error("Sensor read failed", e)
+        self.last_read_ms = now
+        data.update(last)
+        return data
+
+    def _read_dht(self, data):
+        sensor = self.dht
+        sensor.measure()
+        data["temperature"] = sensor.temperature()
+        data["humidity"] = sensor.humidity()
+
+    def _read_ldr(self, data):
+        data["light"] = light_percent(self.ldr.read())
+
+    def _read_pir(self, data):
+        data["motion"] = self.pir.value()
+
+    def rescan_ds18b20(self):
+        """Enumerate the OneWire bus again, e.g. after hot-plugging a probe.
+
+        The bus is otherwise only scanned at start-up; a search walks every
+        device's ROM code, which is too slow to repeat on each read.
+        """
+        try:
+            self.ds_roms = self.ds.scan()
+        except OSError as e:
+            handle_error("DS18B20 scan failed", e)
+            self.ds_roms = []
+        self.ds_started_ms = None
+        return len(self.ds_roms)
+
+    def _read_ds18b20(self, data):
+        """Collect the conversion started by the previous read, then start the next.
+
+        Never waits for the 750 ms conversion: each reading reports the
+        temperatures converted since the read before it.
+        """
+        if not self.ds_roms:
+            return
+        started = self.ds_started_ms
+        now = time.ticks_ms()
+        if started is not None and time.ticks_diff(now, started) >= DS18B20_CONVERSION_MS:
+            for index, rom in enumerate(self.ds_roms):
+                data[f"ds18b20_{index}"] = round(self.ds.read_temp(rom), 2)
+        self.ds.convert_temp()
+        self.ds_started_ms = now
+'''
+
+
+_DATA_LOGGER_PY = '''"""
+Data logger
+Readings are buffered in RAM and written to storage in whole 512-byte
+blocks, so each SD card write covers complete sectors instead of forcing a
+read-modify-write of a partly filled one
+
+With Config.ENABLE_BINARY_LOG each record is packed as a little-endian
+uint32 timestamp followed by one int32 per name in Config.DATA_LOG_FIELDS,
+holding the reading times 100 (MISSING when absent), instead of a JSON line
+"""
+
+import os
+import struct
+import time
+import ujson
+from collections import deque
+from config import Config
+from utils import logger, handle_error
+
+# SD card sector size
+BLOCK_SIZE = 512
+
+# Binary value for a field absent from a reading
+MISSING = -0x80000000
+
+class DataLogger:
+    """Buffered JSON-lines logger with a bounded, drop-oldest buffer.
+
+    Readings are encoded when logged, so callers may reuse their dict.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or Config.DATA_LOG_FILE
+        # A full deque discards its oldest entry on append
+        self.buffer = deque((), Config.DATA_LOG_BUFFER)
+        # Encoded bytes not yet written because they do not fill a block
+        self.pending = bytearray()
+        self.file = None
+        self.offset = 0
+        self.fields = Config.DATA_LOG_FIELDS if Config.ENABLE_BINARY_LOG else None
+        if self.fields:
+            self.record_format = "<I" + "i" * len(self.fields)
+
+    def log_data(self, data):
+        """Encode and buffer one reading; never touches storage."""
+        timestamp = time.time()
+        if self.fields:
+            self.buffer.append(self._pack(timestamp, data))
+        else:
+            self.buffer.append(ujson.dumps({"time": timestamp, "data": data}).encode() + b"\\n")
+
+    def flush(self, final=False):
+        """Write buffered readings, up to the last complete block.
+
+        The tail that would end mid-block is held back for the next flush;
+        `final` writes it as well. Returns the number of bytes written.
+        """
+        while self.buffer:
+            self.pending.extend(self.buffer.popleft())
+
+        try:
+            if self.file is None:
+                self.file = open(self.path, "ab")
+                self.offset = os.stat(self.path)[6]
+
+            if final:
+                size = len(self.pending)
+            else:
+                # Stop at a block boundary of the file, not of the buffer
+                end = self.offset + len(self.pending)
+                size = end - end % BLOCK_SIZE - self.offset
+            if size <= 0:
+                return 0
+
+            self.file.write(memoryview(self.pending)[:size])
+            self.file.flush()
+        except OSError as e:
+            # Drop what could not be written so RAM use stays bounded
+            handle_error("Data log write failed", e)
+            self.pending = bytearray()
+            return 0
+
+        self.offset += size
+        self.pending = self.pending[size:]
+        logger(f"Logged {size} bytes to {self.path}", "DEBUG")
+        return size
+
+    def _pack(self, timestamp, data):
+        """Encode one reading as a fixed-size binary record."""
+        values = []
+        for name in self.fields:
+            value = data.get(name)
+            values.append(MISSING if value is None else int(round(value * 100)))
+        return struct.pack(self.record_format, timestamp, *values)
+
+    def close(self):
+        """Write everything still buffered and close the file."""
+        self.flush(final=True)
+        if self.file:
+            self.file.close()
+            self.file = None
+'''
+
+
+_UTILS_PY = '''"""
+ESP32 IoT Project Utilities
+Logging, error reporting and system information shared by all modules
+"""
+
+import gc
+import sys
+import time
+import machine
+from config import Config
+
+def logger(message, level="INFO"):
+    """Print a timestamped log line; DEBUG lines need Config.DEBUG_LOGGING."""
+    if level == "DEBUG" and not Config.DEBUG_LOGGING:
+        return
+    print(f"[{time.ticks_ms():08d}] {level}: {message}")
+
+def handle_error(context, error):
+    """Log an exception with its context; tracebacks only in debug mode."""
+    logger(f"{context}: {error}", "ERROR")
+    if Config.DEBUG_LOGGING:
+        sys.print_exception(error)
+
+def system_info():
+    """Return a snapshot of memory and CPU information."""
+    return {
+        "platform": sys.platform,
+        "freq": machine.freq(),
+        "free_memory": gc.mem_free(),
+        "allocated_memory": gc.mem_alloc(),
+    }
+'''
+
+_TEST_IOT_PY = '''"""
+Tests for ESP32 IoT Project
+Run on the host: hardware and MicroPython-only modules are mocked
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+# Mock MicroPython modules for testing
+sys.modules['machine'] = Mock()
+for name in ('dht', 'ds18x20', 'onewire', 'network'):
+    sys.modules[name] = Mock()
+sys.modules['ujson'] = json
+
+# MicroPython's millisecond tick counter
+import time
+if not hasattr(time, 'ticks_ms'):
+    time.ticks_ms = lambda: int(time.monotonic() * 1000)
+
+# const() and the code emitters are no-ops on the host
+micropython_stub = Mock()
+micropython_stub.const = lambda value: value
+micropython_stub.viper = lambda func: func
+micropython_stub.native = lambda func: func
+sys.modules['micropython'] = micropython_stub
+
+# Project modules import each other by bare name, as they do on the device
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config import Config
+from utils import logger
+# [data_logging]
+from data_logger import DataLogger, MISSING
+# [/data_logging]
+from sensor_manager import light_percent
+
+class TestConfig(unittest.TestCase):
+    """Test configuration values."""
+
+    def test_intervals_positive(self):
+        """Every task period must be positive."""
+        self.assertGreater(Config.SENSOR_READ_INTERVAL_MS, 0)
+        self.assertGreater(Config.MQTT_PUBLISH_INTERVAL_MS, 0)
+        self.assertGreater(Config.DATA_LOG_FLUSH_INTERVAL_MS, 0)
+
+    def test_retry_backoff_range(self):
+        """WiFi backoff must be able to grow."""
+        self.assertLess(Config.WIFI_RETRY_MIN_MS, Config.WIFI_RETRY_MAX_MS)
+
+class TestUtils(unittest.TestCase):
+    """Test utility functions."""
+
+    def test_logger(self):
+        """Logging must not raise at any level."""
+        logger("Test message")
+        logger("Test debug", "DEBUG")
+        logger("Test error", "ERROR")
+
+class TestSensors(unittest.TestCase):
+    """Test sensor value scaling."""
+
+    def test_light_percent(self):
+        """Light readings span 0-100 over the 12-bit ADC range."""
+        self.assertEqual(light_percent(0), 0)
+        self.assertEqual(light_percent(4095), 100)
+
+# [data_logging]
+class TestDataLogger(unittest.TestCase):
+    """Test buffered data logging."""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_json_lines(self):
+        """Each reading becomes one JSON line once flushed."""
+        log = DataLogger(self.path)
+        log.fields = None
+        log.log_data({"temperature": 21.5})
+        log.close()
+
+        with open(self.path) as f:
+            record = json.loads(f.readline())
+        self.assertEqual(record["data"], {"temperature": 21.5})
+
+    def test_binary_record(self):
+        """Binary records store values times 100 and mark missing ones."""
+        log = DataLogger(self.path)
+        log.fields = ("temperature", "humidity")
+        log.record_format = "<Iii"
+        record = log._pack(1, {"temperature": 21.5})
+        self.assertEqual(record[4:8], (2150).to_bytes(4, "little", signed=True))
+        self.assertEqual(record[8:], MISSING.to_bytes(4, "little", signed=True))
+
+# [/data_logging]
+if __name__ == '__main__':
+    unittest.main()
+'''
+
+_API_DOCS_TPL = Template('''# $project_name API Documentation
+
+## Overview
+This document describes the modules, MQTT topics and REST API of the IoT
+ESP32 project.
+
+## Modules
+
+### main.py
+Application entry point; runs every task on the uasyncio event loop.
+
+#### Functions
+- `setup()` - Initialize WiFi, sensors, MQTT, web server and data logger
+- `sensor_task()` - Sample sensors on a hardware timer
+- `mqtt_task()` - Publish readings and status as one batch message
+- `mqtt_rx_task()` - Read inbound MQTT messages
+- `mqtt_delivery_task()` - Run QoS 1 delivery callbacks and control handlers
+- `wifi_task()` - Drive the non-blocking WiFi state machine
+- `status_task()` - Reconnect MQTT when the connection drops
+- `data_log_task()` - Flush buffered readings to storage
+- `gc_task()` - Collect garbage when free memory runs low
+- `main()` - Application entry point
+
+### config.py
+- `Config` - Pins, intervals, WiFi, MQTT, web server and logging settings
+
+### wifi_manager.py
+- `WiFiManager` - Station-mode connection with reconnect backoff and lease reuse
+
+### mqtt_client.py
+- `MQTTClient` - Queued publisher with a background sender thread
+  - `on_control(command, handler)` - Handle `<prefix>/control/<command>` on the event loop
+
+### sensor_manager.py
+- `SensorManager` - DHT22, light sensor, PIR and DS18B20 readings
+  - `read_all(into=None)` - Read every sensor, cached for `SENSOR_CACHE_MS`
+
+### web_server.py
+- `WebServer` - Dashboard and REST API server
+
+### data_logger.py
+- `DataLogger` - Block-aligned JSON-lines or binary logger
+
+### utils.py
+- `logger(message, level)` - Logging function
+- `handle_error(context, error)` - Error reporting
+- `system_info()` - Memory and CPU information
+
+## MQTT Topics
+| Topic | Direction | Payload |
+|-------|-----------|---------|
+| `<prefix>/batch` | Published | JSON `{"sensors": {...}, "status": {...}}` |
+| `<prefix>/batch/z` | Published | Same, zlib-compressed when large |
+| `<prefix>/status` | Published | JSON uptime and free memory |
+| `<prefix>/control/led` | Subscribed | `on` or `off` |
+| `<prefix>/control/restart` | Subscribed | Any |
+| `<prefix>/control/status` | Subscribed | Any; triggers a status message |
+
+## REST API
+| Method | Path | Response |
+|--------|------|----------|
+| GET | `/api/sensors` | Latest sensor readings |
+| GET | `/api/status` | Uptime, free memory and MQTT state |
+| GET | `/` | Dashboard (`assets/web/index.html`) |
+''')
+
+_INDEX_HTML = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>ESP32 IoT Dashboard</title>
+    <link rel="stylesheet" href="/styles.css">
+</head>
+<body>
+    <header>
+        <h1>ESP32 IoT Dashboard</h1>
+        <span id="connection" class="badge">connecting...</span>
+    </header>
+    <main>
+        <section>
+            <h2>Sensors</h2>
+            <dl id="sensors"></dl>
+        </section>
+        <section>
+            <h2>Status</h2>
+            <dl id="status"></dl>
+        </section>
+    </main>
+    <script src="/scripts.js"></script>
+</body>
+</html>
+'''
+
+_STYLES_CSS = '''body {
+    margin: 0;
+    font-family: system-ui, sans-serif;
+    background: #f4f6f8;
+    color: #222;
+}
+
+header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    padding: 1rem 1.5rem;
+    background: #1e3a5f;
+    color: #fff;
+}
+
+h1 {
+    margin: 0;
+    font-size: 1.4rem;
+}
+
+main {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
+    gap: 1rem;
+    padding: 1.5rem;
+}
+
+section {
+    padding: 1rem;
+    background: #fff;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+}
+
+dl {
+    display: grid;
+    grid-template-columns: auto 1fr;
+    gap: 0.4rem 1rem;
+    margin: 0;
+}
+
+dt {
+    font-weight: 600;
+}
+
+dd {
+    margin: 0;
+    text-align: right;
+}
+
+.badge {
+    padding: 0.2rem 0.6rem;
+    border-radius: 999px;
+    background: #888;
+    font-size: 0.85rem;
+}
+
+.badge.online {
+    background: #2e7d32;
+}
+
+.badge.offline {
+    background: #c62828;
+}
+'''
+
+_SCRIPTS_JS = '''// Poll the REST API and render the latest readings
+const REFRESH_MS = 5000;
+
+function render(id, data) {
+    const list = document.getElementById(id);
+    list.replaceChildren();
+    for (const [key, value] of Object.entries(data)) {
+        const term = document.createElement("dt");
+        term.textContent = key.replace(/_/g, " ");
+        const detail = document.createElement("dd");
+        detail.textContent = typeof value === "number" ? +value.toFixed(2) : String(value);
+        list.append(term, detail);
+    }
+}
+
+function setConnection(online) {
+    const badge = document.getElementById("connection");
+    badge.textContent = online ? "online" : "offline";
+    badge.className = "badge " + (online ? "online" : "offline");
+}
+
+async function refresh() {
+    try {
+        const [sensors, status] = await Promise.all([
+            fetch("/api/sensors").then((r) => r.json()),
+            fetch("/api/status").then((r) => r.json()),
+        ]);
+        render("sensors", sensors);
+        render("status", status);
+        setConnection(true);
+    } catch (err) {
+        setConnection(false);
+    }
+}
+
+refresh();
+setInterval(refresh, REFRESH_MS);
+'''
+
+# Reference copy of the main settings in config.py, for tools that read JSON
+_DEFAULT_CONFIG_JSON = '''{
+  "wifi": {
+    "ssid": "your_wifi_ssid",
+    "password": "your_wifi_password",
+    "fast_reconnect": true
+  },
+  "mqtt": {
+    "broker": "192.168.1.100",
+    "port": 1883,
+    "topic_prefix": "esp32",
+    "keepalive": 60
+  },
+  "intervals_ms": {
+    "sensor_read": 5000,
+    "mqtt_publish": 10000,
+    "status_check": 30000,
+    "data_log_flush": 60000
+  },
+  "web_server": {
+    "port": 80
+  },
+  "data_logging": {
+    "file": "/sd/sensor_data.log",
+    "binary": false
+  }
+}
+'''
+
+
+# Web assets also shipped pre-compressed, so the device can serve them with
+# Content-Encoding: gzip instead of sending (or compressing) the plain text
+_WEB_ASSETS = ('assets/web/index.html', 'assets/web/styles.css', 'assets/web/scripts.js')
+
+# Optional features and the generated files that exist only for them
+_FEATURE_FILES = {
+    'mqtt': ('src/mqtt_client.py',),
+    'web_server': ('src/web_server.py', *_WEB_ASSETS),
+    'data_logging': ('src/data_logger.py',),
+}
+
+_SECTION_RE = re.compile(r'^[ \t]*# \[(/?)(\w+)\]\n', re.MULTILINE)
+
+def _select_sections(source: str, disabled: frozenset[str]) -> str:
+    """Drop ``# [feature]`` ... ``# [/feature]`` sections for disabled features.
+
+    Marker lines are always removed; sections do not nest.
+    """
+    parts = []
+    pos = 0
+    skipping = False
+    for match in _SECTION_RE.finditer(source):
+        closing, feature = match.groups()
+        if not skipping:
+            parts.append(source[pos:match.start()])
+        skipping = not closing and feature in disabled
+        pos = match.end()
+    parts.append(source[pos:])
+    return "".join(parts)
+
+
+class IoTTemplate(BaseTemplate):
+    """IoT project template with Wi-Fi, MQTT, sensors, and web server."""
+
+    __slots__ = ()
+
+    description = (
+        "Complete IoT solution with WiFi connectivity, MQTT communication, sensor readings, and web interface"
+    )
+    author = "ESP32Manager"
+    version = "1.0.0"
+    features = [
+        "WiFi connection management",
+        "MQTT client with auto-reconnect",
+        "Sensor data collection",
+        "Web server with REST API",
+        "Configuration management",
+        "OTA updates support",
+        "Data logging to SD card",
+        "Real-time dashboard",
+    ]
+    dependencies = [
+        "umqtt.simple",
+        "upip",
+        "ujson",
+    ]
+
+    def generate_files(self) -> dict[str, str | bytes]:
+        """Generate all IoT project files."""
+        return {
+            **self.get_common_files(),
+            # Template-specific files
+            **self._static_files(self.disabled_features()),
+            'docs/API.md': self._generate_api_docs(),
+        }
+
+    def disabled_features(self) -> frozenset[str]:
+        """Optional features switched off in the project's build config."""
+        build_config = getattr(self.config, 'build_config', None) or {}
+        return frozenset(build_config.get('disabled_features', ())).intersection(_FEATURE_FILES)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _static_files(cls, disabled: frozenset[str] = frozenset()) -> Mapping[str, str | bytes]:
+        """Project-independent files, rendered once per feature selection.
+
+        Disabled features are removed at generation time: their sections are
+        cut from main.py and the tests, and their files are not emitted at all.
+        """
+        files = {
+            'src/main.py': _select_sections(cls._generate_main(), disabled),
+            'src/config.py': cls._generate_config(),
+            'src/wifi_manager.py': cls._generate_wifi_manager(),
+            'src/mqtt_client.py': cls._generate_mqtt_client(),
+            'src/sensor_manager.py': cls._generate_sensor_manager(),
+            'src/web_server.py': cls._generate_web_server(),
+            'src/data_logger.py': cls._generate_data_logger(),
+            'src/utils.py': cls._generate_utils(),
+            'tests/test_iot.py': _select_sections(cls._generate_tests(), disabled),
+            'assets/web/index.html': cls._generate_web_interface(),
+            'assets/web/styles.css': cls._generate_web_styles(),
+            'assets/web/scripts.js': cls._generate_web_scripts(),
+            'assets/config.json': cls._generate_default_config(),
+        }
+        for feature in disabled:
+            for path in _FEATURE_FILES.get(feature, ()):
+                files.pop(path, None)
+        for path in _WEB_ASSETS:
+            content = files.get(path)
+            if isinstance(content, str):
+                # mtime=0 keeps regenerated projects byte-identical
+                files[path + '.gz'] = gzip.compress(content.encode('utf-8'), 9, mtime=0)
+        return MappingProxyType({sys.intern(path): content for path, content in files.items()})
+
+    @staticmethod
+    def _get_usage_instructions() -> str:
+        """Get IoT template usage instructions."""
+        return _USAGE_INSTRUCTIONS
+
+    @staticmethod
+    def _generate_main() -> str:
+        """Generate IoT main.py file."""
+        return _MAIN_PY
+
+    @staticmethod
+    def _generate_config() -> str:
+        """Generate IoT config.py file."""
+        return _CONFIG_PY
+
+    @staticmethod
+    def _generate_wifi_manager() -> str:
+        """Generate IoT wifi_manager.py file."""
+        return _WIFI_MANAGER_PY
+
+    @staticmethod
+    def _generate_mqtt_client() -> str:
+        """Generate IoT mqtt_client.py file."""
+        return _MQTT_CLIENT_PY
+
+    @staticmethod
+    def _generate_web_server() -> str:
+        """Generate IoT web_server.py file."""
+        return _WEB_SERVER_PY
+
+    @staticmethod
+    def _generate_sensor_manager() -> str:
+        """Generate IoT sensor_manager.py file."""
+        return _SENSOR_MANAGER_PY
+
+    @staticmethod
+    def _generate_data_logger() -> str:
         """Generate IoT data_logger.py file."""
+        return _DATA_LOGGER_PY
 
-    def _generate_utils(self) -> bool:
+    @staticmethod
+    def _generate_utils() -> str:
         """Generate IoT utils.py file."""
+        return _UTILS_PY
 
-    def _generate_tests(self) -> bool:
+    @staticmethod
+    def _generate_tests() -> str:
         """Generate IoT test_iot.py file."""
+        return _TEST_IOT_PY
 
-    def _generate_api_docs(self) -> bool:
+    def _generate_api_docs(self) -> str:
         """Generate IoT API.md file."""
+        return _API_DOCS_TPL.substitute(project_name=self.project_name)
 
-    def _generate_web_interface(self) -> bool:
+    @staticmethod
+    def _generate_web_interface() -> str:
         """Generate IoT index.html file."""
+        return _INDEX_HTML
 
-    def _generate_web_styles(self) -> bool:
+    @staticmethod
+    def _generate_web_styles() -> str:
         """Generate IoT styles.css file."""
+        return _STYLES_CSS
 
-    def _generate_web_scripts(self) -> bool:
+    @staticmethod
+    def _generate_web_scripts() -> str:
         """Generate IoT scripts.js file."""
+        return _SCRIPTS_JS
 
-    def _generate_default_config(self) -> bool:
-        """Generate IoT default config.json file."""
\ No newline at end of file
+    @staticmethod
+    def _generate_default_config() -> str:
+        """Generate IoT default config.json file."""
+        return _DEFAULT_CONFIG_JSON
\ No newline at end of file
@@ -6,11 +6,14 @@ are intentionally lightweight and are not meant to be a full linter.
 """
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Optional
 import ast
+import json
+import os
 
-EXCLUDE_DIRS = {
+EXCLUDE_DIRS = frozenset({
     "venv",
     ".venv",
     "build",
@@ -18,23 +21,59 @@ EXCLUDE_DIRS = {
     "__pycache__",
     ".git",
     ".hg",
-}
+})
 
 # Modules that are known to be unavailable or only partially supported in
 # MicroPython. Importing them is likely to cause runtime failures on the
 # device, so we flag them here.
-FORBIDDEN_IMPORTS = {
+FORBIDDEN_IMPORTS = frozenset({
     "asyncio",
     "multiprocessing",
     "subprocess",
     "threading",
-}
+})
 
 # Maximum allowed line length. MicroPython targets often have limited screen
 # real estate, so we keep this conservative.
 MAX_LINE_LENGTH = 88
 
-def _analyze_file(path: Path) -> list[str] | None:
+# Below this many files, starting worker processes costs more than it saves.
+PARALLEL_MIN_FILES = 64
+
+# Nodes that can contain statements. Import checking only descends into
+# these, skipping expression subtrees, which cannot hold imports.
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+class _ImportChecker(ast.NodeVisitor):
+    """Collect warnings for forbidden imports, visiting statements only."""
+
+    def __init__(self, path: str, warnings: List[str]) -> None:
+        self.path = path
+        self.warnings = warnings
+
+    def _check(self, node: ast.stmt, modules: Iterable[str]) -> None:
+        for module in modules:
+            if module in FORBIDDEN_IMPORTS:
+                self.warnings.append(
+                    f"{self.path}:{node.lineno} Forbidden import '{module}'"
+                )
+
+    def visit_Import(self, node: ast.Import) -> None:
+        self._check(node, (alias.name.partition(".")[0] for alias in node.names))
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        self._check(node, [(node.module or "").partition(".")[0]])
+
+    def generic_visit(self, node: ast.AST) -> None:
+        for _field, value in ast.iter_fields(node):
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _STATEMENT_CONTAINERS):
+                        self.visit(item)
+
+
+def _analyze_file(path: Path) -> List[str]:
     """Analyze a single Python file and return a list of warnings.
 
     Parameters
@@ -44,52 +83,91 @@ def _analyze_file(path: Path) -> list[str] | None:
     """
 
     warnings: List[str] = []
+    path_str = str(path)
 
     try:
-        text = path.read_text(encoding='utf-8')
-    except (UnicodeDecodeError, OSError):
-        # Skip files that cannot be decoded as UTF-8 or read for any reason.
+        data = path.read_bytes()
+    except OSError:
         return warnings
 
+    # Byte length equals character length for ASCII files, so only files
+    # that contain non-ASCII characters need decoding for this check.
+    lines: Iterable[bytes | str]
+    if data.isascii():
+        lines = data.splitlines()
+    else:
+        try:
+            lines = data.decode('utf-8').splitlines()
+        except UnicodeDecodeError:
+            # Skip files that cannot be decoded as UTF-8.
+            return warnings
+
     # Line length check
-    for lineno, line in enumerate(text.splitlines(), start=1):
+    for lineno, line in enumerate(lines, start=1):
         if len(line) > MAX_LINE_LENGTH:
             warnings.append(
-                f"{path}:{lineno} Line too long ({len(line)} > {MAX_LINE_LENGTH})"
+                f"{path_str}:{lineno} Line too long ({len(line)} > {MAX_LINE_LENGTH})"
             )
 
-        # Parse AST to inspect imports
-        try:
-            tree = ast.parse(text, filename=str(path))
-        except SyntaxError as exc:
-            warnings.append(f"{path}:{exc.lineno} SyntaxError: {exc.msg}")
-            return warnings
+    # Parse AST once to inspect imports
+    try:
+        tree = compile(data, path_str, "exec", flags=ast.PyCF_ONLY_AST)
+    except SyntaxError as exc:
+        warnings.append(f"{path_str}:{exc.lineno} SyntaxError: {exc.msg}")
+        return warnings
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                modules: Iterable[str] = (alias.name.split(".")[0] for alias in node.names)
-            elif isinstance(node, ast.ImportFrom):
-                modules = [(node.module or "").split(".")[0]]
-            else:
-                continue
+    _ImportChecker(path_str, warnings).visit(tree)
+    return warnings
 
-            for module in modules:
-                if module in FORBIDDEN_IMPORTS:
-                    warnings.append(
-                        f"{path}:{node.lineno} Forbidden import '{module}'"
-                    )
 
-        return warnings
-    return None
+def _iter_python_files(path: Path | str) -> Iterator[os.DirEntry]:
+    """Yield ``.py`` file entries under ``path``, skipping excluded directories.
+
+    Entries come straight from :func:`os.scandir`, so file types are known
+    without a ``stat`` call and callers can reuse ``entry.stat()``.
+    """
+
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield entry
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _iter_python_files(subdir)
+
+
+def _load_cache(cache_file: Path) -> Dict[str, list]:
+    try:
+        return json.loads(cache_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
 
 
-def analyze_project(path: Path) -> List[str]:
+def _save_cache(cache_file: Path, cache: Dict[str, list]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache), encoding='utf-8')
+    except OSError:
+        # A cache that cannot be written only costs a re-parse next time.
+        pass
+
+
+def analyze_project(path: Path, cache_file: Optional[Path] = None) -> List[str]:
     """Analyze all Python files under ``path`` for MicroPython compatibility.
 
     Parameters
     ----------
     path:
         Root directory of the project to analyze.
+    cache_file:
+        Optional JSON file holding results from earlier runs. Files whose
+        modification time and size are unchanged are not analyzed again.
 
     Returns
     -------
@@ -97,11 +175,46 @@ def analyze_project(path: Path) -> List[str]:
         A list of warning strings describing potential issues.
     """
 
-    results: List[str] = []
-    for file_path in path.rglob("*.py"):
-        if any(part in EXCLUDE_DIRS for part in file_path.parts):
+    files: List[Path] = []
+    cache = _load_cache(cache_file) if cache_file else {}
+    stamps: Dict[Path, list] = {}
+    found: Dict[Path, List[str]] = {}
+    stale: List[Path] = []
+    for entry in _iter_python_files(path):
+        try:
+            st = entry.stat()
+        except OSError:
             continue
-        results.extend(_analyze_file(file_path))
+        file_path = Path(entry.path)
+        files.append(file_path)
+        stamps[file_path] = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(str(file_path))
+        if cached and cached[:2] == stamps[file_path]:
+            found[file_path] = cached[2]
+        else:
+            stale.append(file_path)
+
+    if len(stale) < PARALLEL_MIN_FILES:
+        analyzed = map(_analyze_file, stale)
+    else:
+        # Parsing is CPU-bound and holds the GIL, so fan out to processes
+        workers = os.cpu_count() or 1
+        # About four chunks per worker balances load against IPC round trips
+        chunksize = max(1, len(stale) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            analyzed = list(executor.map(_analyze_file, stale, chunksize=chunksize))
+    found.update(zip(stale, analyzed))
+
+    results: List[str] = []
+    for file_path in files:
+        results.extend(found.get(file_path, ()))
+
+    if cache_file:
+        # Only files seen in this run are kept, dropping deleted ones
+        _save_cache(cache_file, {
+            str(file_path): [*stamp, found[file_path]]
+            for file_path, stamp in stamps.items()
+        })
     return results
 
 __all__ = ["analyze_project"]
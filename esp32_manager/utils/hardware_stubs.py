@@ -6,6 +6,9 @@ This module provides simulation stubs for ESP32 hardware components
 to allow local testing and development without physical hardware.
 """
 
+import heapq
+import itertools
+import os
 import time
 import threading
 import random
@@ -15,6 +18,10 @@ from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Echo simulated I/O to stdout; set ESP32_SIM_VERBOSE=0 to silence it (and
+# skip formatting the messages) in tight simulation loops
+_VERBOSE = os.environ.get("ESP32_SIM_VERBOSE", "1") != "0"
+
 # Global simulation state
 _simulation_state = {
     'pins': {},
@@ -25,9 +32,17 @@ _simulation_state = {
     'running': True,
     'start_time': time.time(),
 }
+_pins: Dict[int, 'PinState'] = _simulation_state['pins']
+
+
+# IRQ trigger bits, also exposed as Pin.IRQ_*
+IRQ_FALLING = 1
+IRQ_RISING = 2
+IRQ_LOW_LEVEL = 4
+IRQ_HIGH_LEVEL = 8
 
 
-@dataclass
+@dataclass(slots=True)
 class PinState:
     """Represents the state of a GPIO pin."""
     pin_num: int
@@ -52,24 +67,21 @@ class Pin:
     PULL_DOWN = 2
 
     # IRQ triggers
-    IRQ_FALLING = 1
-    IRQ_RISING = 2
-    IRQ_LOW_LEVEL = 4
-    IRQ_HIGH_LEVEL = 8
+    IRQ_FALLING = IRQ_FALLING
+    IRQ_RISING = IRQ_RISING
+    IRQ_LOW_LEVEL = IRQ_LOW_LEVEL
+    IRQ_HIGH_LEVEL = IRQ_HIGH_LEVEL
 
     def __init__(self, pin_num: int, mode: int = IN, pull: Optional[int] = None, value: Optional[int] = None):
         self.pin_num = pin_num
 
-        # Initialize pin state if not exists
-        if pin_num not in _simulation_state['pins']:
-            _simulation_state['pins'][pin_num] = PinState(pin_num)
-
-        self.state = _simulation_state['pins'][pin_num]
+        # Initialize pin state if not exists; a single lookup once it does
+        self.state = _pins.get(pin_num) or _pins.setdefault(pin_num, PinState(pin_num))
 
         # Configure pin
         self.init(mode, pull, value)
 
-        logger.debug(f"Pin {pin_num} initialized: mode={mode}, pull={pull}, value={value}")
+        logger.debug("Pin %s initialized: mode=%s, pull=%s, value=%s", pin_num, mode, pull, value)
 
     def init(self, mode: int, pull: Optional[int] = None, value: Optional[int] = None):
         """Initialize pin configuration."""
@@ -85,11 +97,12 @@ class Pin:
 
     def value(self, val: Optional[int] = None) -> int:
         """Get or set pin value."""
+        state = self.state
         if val is not None:
-            if self.state.mode == self.OUT:
-                old_value = self.state.value
-                self.state.value = val
-                self.state.last_change = time.time()
+            if state.mode == self.OUT:
+                old_value = state.value
+                state.value = val
+                state.last_change = time.time()
 
                 # Simulate LED or other output
                 self._simulate_output_change(old_value, val)
@@ -97,9 +110,9 @@ class Pin:
                 # Trigger IRQ if configured
                 self._check_irq_trigger(old_value, val)
             else:
-                logger.warning(f"Attempted to write to input pin {self.pin_num}")
+                logger.warning("Attempted to write to input pin %s", self.pin_num)
 
-        return self.state.value
+        return state.value
 
     def on(self):
         """Set pin high."""
@@ -115,11 +128,11 @@ class Pin:
         self.state.irq_trigger = trigger
 
         if handler:
-            logger.debug(f"IRQ configured on pin {self.pin_num}, trigger={trigger}")
+            logger.debug("IRQ configured on pin %s, trigger=%s", self.pin_num, trigger)
 
     def _simulate_output_change(self, old_value: int, new_value: int):
         """Simulate output changes (LED, etc.)."""
-        if old_value != new_value:
+        if _VERBOSE and old_value != new_value:
             if self.pin_num == 2:  # Built-in LED
                 state = "ON" if new_value else "OFF"
                 print(f"💡 Built-in LED: {state}")
@@ -128,26 +141,25 @@ class Pin:
 
     def _check_irq_trigger(self, old_value: int, new_value: int):
         """Check and trigger IRQ if conditions are met."""
-        if not self.state.irq_handler:
+        state = self.state
+        handler = state.irq_handler
+        if not handler:
             return
 
-        trigger = False
-
-        if self.state.irq_trigger & self.IRQ_FALLING and old_value == 1 and new_value == 0:
-            trigger = True
-        elif self.state.irq_trigger & self.IRQ_RISING and old_value == 0 and new_value == 1:
-            trigger = True
-        elif self.state.irq_trigger & self.IRQ_LOW_LEVEL and new_value == 0:
-            trigger = True
-        elif self.state.irq_trigger & self.IRQ_HIGH_LEVEL and new_value == 1:
-            trigger = True
+        bits = state.irq_trigger
+        if new_value == 0:
+            trigger = bits & IRQ_LOW_LEVEL or (bits & IRQ_FALLING and old_value == 1)
+        elif new_value == 1:
+            trigger = bits & IRQ_HIGH_LEVEL or (bits & IRQ_RISING and old_value == 0)
+        else:
+            trigger = False
 
         if trigger:
             try:
-                self.state.irq_handler(self)
-                logger.debug(f"IRQ triggered on pin {self.pin_num}")
+                handler(self)
+                logger.debug("IRQ triggered on pin %s", self.pin_num)
             except Exception as e:
-                logger.error(f"IRQ handler error on pin {self.pin_num}: {e}")
+                logger.error("IRQ handler error on pin %s: %s", self.pin_num, e)
 
 
 class ADC:
@@ -167,21 +179,32 @@ class ADC:
         self.pin = pin
         self.atten = atten
         self._noise_level = 50  # Simulate ADC noise
-        logger.debug(f"ADC initialized on pin {pin.pin_num}")
+        logger.debug("ADC initialized on pin %s", pin.pin_num)
 
     def read(self) -> int:
         """Read ADC value (simulated)."""
-        # Simulate realistic ADC readings
-        base_value = random.randint(0, 4095)  # 12-bit ADC
-        noise = random.randint(-self._noise_level, self._noise_level)
-        value = max(0, min(4095, base_value + noise))
+        # Simulate realistic 12-bit ADC readings
+        noise = self._noise_level
+        value = random.getrandbits(12) + random.randrange(-noise, noise + 1)
+        value = 0 if value < 0 else 4095 if value > 4095 else value
 
-        logger.debug(f"ADC read from pin {self.pin.pin_num}: {value}")
+        logger.debug("ADC read from pin %s: %s", self.pin.pin_num, value)
         return value
 
     def read_u16(self) -> int:
         """Read ADC value as 16-bit."""
-        return self.read() << 4  # Scale 12-bit to 16-bit
+        # Same sampling as read(), inlined to save a method call per sample
+        noise = self._noise_level
+        value = random.getrandbits(12) + random.randrange(-noise, noise + 1)
+        value = 0 if value < 0 else 4095 if value > 4095 else value
+
+        logger.debug("ADC read from pin %s: %s", self.pin.pin_num, value)
+        return value << 4  # Scale 12-bit to 16-bit
+
+
+# Scale factors from raw duty values to a percentage
+_DUTY_10BIT_PERCENT = 100 / 1023
+_DUTY_16BIT_PERCENT = 100 / 65535
 
 
 class PWM:
@@ -192,13 +215,13 @@ class PWM:
         self._freq = freq
         self._duty = duty
         self._running = False
-        logger.debug(f"PWM initialized on pin {pin.pin_num}: freq={freq}Hz, duty={duty}")
+        logger.debug("PWM initialized on pin %s: freq=%sHz, duty=%s", pin.pin_num, freq, duty)
 
     def freq(self, frequency: Optional[int] = None) -> int:
         """Get or set PWM frequency."""
         if frequency is not None:
             self._freq = frequency
-            logger.debug(f"PWM freq set to {frequency}Hz on pin {self.pin.pin_num}")
+            logger.debug("PWM freq set to %sHz on pin %s", frequency, self.pin.pin_num)
         return self._freq
 
     def duty(self, duty_cycle: Optional[int] = None) -> int:
@@ -206,20 +229,79 @@ class PWM:
         if duty_cycle is not None:
             self._duty = duty_cycle
             # Simulate PWM output
-            percentage = (duty_cycle / 1023) * 100
-            print(f"🔄 PWM GPIO{self.pin.pin_num}: {percentage:.1f}% duty")
-            logger.debug(f"PWM duty set to {duty_cycle} on pin {self.pin.pin_num}")
+            if _VERBOSE:
+                print(f"🔄 PWM GPIO{self.pin.pin_num}: {duty_cycle * _DUTY_10BIT_PERCENT:.1f}% duty")
+            logger.debug("PWM duty set to %s on pin %s", duty_cycle, self.pin.pin_num)
         return self._duty
 
     def duty_u16(self, duty_cycle: Optional[int] = None) -> int:
         """Get or set PWM duty cycle as 16-bit."""
         if duty_cycle is not None:
             self._duty = duty_cycle >> 6  # Convert 16-bit to 10-bit
-            percentage = (duty_cycle / 65535) * 100
-            print(f"🔄 PWM GPIO{self.pin.pin_num}: {percentage:.1f}% duty")
+            if _VERBOSE:
+                print(f"🔄 PWM GPIO{self.pin.pin_num}: {duty_cycle * _DUTY_16BIT_PERCENT:.1f}% duty")
         return self._duty << 6
 
 
+class _TimerScheduler:
+    """Single background thread that runs every simulated timer.
+
+    Due times live in a heap, so the thread sleeps until the earliest one
+    instead of each timer owning a thread of its own.
+    """
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()  # Tie-breaker; timers are not comparable
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, timer: 'Timer', generation: int):
+        """Queue the first expiry of a started timer."""
+        deadline = time.monotonic() + timer._period / 1000.0
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, next(self._counter), timer, generation))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _run(self):
+        # Bound once, as this loop runs for every tick of every timer
+        heap, cond, counter = self._heap, self._cond, self._counter
+        monotonic, heappop, heappush = time.monotonic, heapq.heappop, heapq.heappush
+        while True:
+            with cond:
+                while True:
+                    if not heap:
+                        cond.wait()
+                        continue
+                    delay = heap[0][0] - monotonic()
+                    if delay <= 0:
+                        break
+                    cond.wait(delay)
+                deadline, _, timer, generation = heappop(heap)
+
+                # A stop() or restart since scheduling invalidates the entry
+                if not timer._running or generation != timer._generation:
+                    continue
+                if timer._mode == Timer.PERIODIC:
+                    next_deadline = deadline + timer._period / 1000.0
+                    heappush(heap, (next_deadline, next(counter), timer, generation))
+                else:
+                    timer._running = False
+
+            # Callbacks run outside the lock so they may start or stop timers
+            if timer._callback:
+                try:
+                    timer._callback(timer)
+                except Exception as e:
+                    logger.error("Timer %s callback error: %s", timer.timer_id, e)
+
+
+_timer_scheduler = _TimerScheduler()
+
+
 class Timer:
     """Simulated Timer."""
 
@@ -232,17 +314,18 @@ class Timer:
         self._period = 0
         self._mode = self.ONE_SHOT
         self._running = False
-        self._thread = None
+        # Bumped on every start/stop so stale scheduler entries are skipped
+        self._generation = 0
 
         _simulation_state['timers'][timer_id] = self
-        logger.debug(f"Timer {timer_id} created")
+        logger.debug("Timer %s created", timer_id)
 
     def init(self, mode: int = ONE_SHOT, period: int = 1000, callback: Optional[Callable] = None):
         """Initialize timer."""
         self._mode = mode
         self._period = period
         self._callback = callback
-        logger.debug(f"Timer {self.timer_id} initialized: mode={mode}, period={period}ms")
+        logger.debug("Timer %s initialized: mode=%s, period=%sms", self.timer_id, mode, period)
 
     def callback(self, handler: Callable):
         """Set timer callback."""
@@ -254,32 +337,15 @@ class Timer:
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._timer_loop, daemon=True)
-        self._thread.start()
-        logger.debug(f"Timer {self.timer_id} started")
+        self._generation += 1
+        _timer_scheduler.schedule(self, self._generation)
+        logger.debug("Timer %s started", self.timer_id)
 
     def stop(self):
         """Stop timer."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=1)
-        logger.debug(f"Timer {self.timer_id} stopped")
-
-    def _timer_loop(self):
-        """Timer execution loop."""
-        while self._running:
-            time.sleep(self._period / 1000.0)
-
-            if self._callback and self._running:
-                try:
-                    self._callback(self)
-                except Exception as e:
-                    logger.error(f"Timer {self.timer_id} callback error: {e}")
-
-            if self._mode == self.ONE_SHOT:
-                break
-
-        self._running = False
+        self._generation += 1
+        logger.debug("Timer %s stopped", self.timer_id)
 
 
 class UART:
@@ -290,16 +356,18 @@ class UART:
         self.baudrate = baudrate
         self.tx_pin = tx
         self.rx_pin = rx
-        self._buffer = []
+        # Received bytes; consumed from the front with del, a C-level memmove
+        self._buffer = bytearray()
 
         _simulation_state['uart_devices'][uart_id] = self
-        logger.debug(f"UART {uart_id} initialized: baudrate={baudrate}")
+        logger.debug("UART %s initialized: baudrate=%s", uart_id, baudrate)
 
     def write(self, data: bytes):
         """Write data to UART."""
-        text = data.decode('utf-8', errors='ignore')
-        print(f"📡 UART{self.uart_id} TX: {text.strip()}")
-        logger.debug(f"UART {self.uart_id} wrote {len(data)} bytes")
+        if _VERBOSE:
+            text = data.decode('utf-8', errors='ignore')
+            print(f"📡 UART{self.uart_id} TX: {text.strip()}")
+        logger.debug("UART %s wrote %s bytes", self.uart_id, len(data))
 
     def read(self, num_bytes: Optional[int] = None) -> Optional[bytes]:
         """Read data from UART."""
@@ -311,26 +379,30 @@ class UART:
             self._buffer.clear()
         else:
             data = bytes(self._buffer[:num_bytes])
-            self._buffer = self._buffer[num_bytes:]
+            del self._buffer[:num_bytes]
 
-        logger.debug(f"UART {self.uart_id} read {len(data)} bytes")
+        logger.debug("UART %s read %s bytes", self.uart_id, len(data))
         return data
 
     def readline(self) -> Optional[bytes]:
         """Read a line from UART."""
-        try:
-            newline_idx = self._buffer.index(ord('\n'))
-            line = bytes(self._buffer[:newline_idx + 1])
-            self._buffer = self._buffer[newline_idx + 1:]
-            return line
-        except ValueError:
+        newline_idx = self._buffer.find(b'\n')
+        if newline_idx < 0:
             return None
+        line = bytes(self._buffer[:newline_idx + 1])
+        del self._buffer[:newline_idx + 1]
+        return line
 
     def any(self) -> int:
         """Check if data is available."""
         return len(self._buffer)
 
 
+# Simulated device addresses reported by I2C.scan (common sensors)
+_I2C_SCAN_DEVICES = (0x48, 0x68, 0x76)
+_I2C_SCAN_HEX = str([hex(addr) for addr in _I2C_SCAN_DEVICES])
+
+
 class I2C:
     """Simulated I2C communication."""
 
@@ -342,26 +414,28 @@ class I2C:
         self._devices = {}  # Simulated I2C devices
 
         _simulation_state['i2c_devices'][i2c_id] = self
-        logger.debug(f"I2C {i2c_id} initialized: SCL=GPIO{scl.pin_num}, SDA=GPIO{sda.pin_num}, freq={freq}Hz")
+        logger.debug("I2C %s initialized: SCL=GPIO%s, SDA=GPIO%s, freq=%sHz",
+                     i2c_id, scl.pin_num, sda.pin_num, freq)
 
     def scan(self) -> List[int]:
         """Scan for I2C devices."""
-        # Return some simulated device addresses
-        devices = [0x48, 0x68, 0x76]  # Common sensor addresses
-        logger.debug(f"I2C scan found devices: {[hex(addr) for addr in devices]}")
-        return devices
+        logger.debug("I2C scan found devices: %s", _I2C_SCAN_HEX)
+        # A fresh list, as MicroPython returns one callers may modify
+        return list(_I2C_SCAN_DEVICES)
 
     def writeto(self, addr: int, buf: bytes):
         """Write to I2C device."""
-        print(f"📤 I2C write to {hex(addr)}: {buf.hex()}")
-        logger.debug(f"I2C wrote {len(buf)} bytes to {hex(addr)}")
+        if _VERBOSE:
+            print(f"📤 I2C write to {hex(addr)}: {buf.hex()}")
+        logger.debug("I2C wrote %s bytes to %#x", len(buf), addr)
 
     def readfrom(self, addr: int, nbytes: int) -> bytes:
         """Read from I2C device."""
         # Return simulated data
-        data = bytes([random.randint(0, 255) for _ in range(nbytes)])
-        print(f"📥 I2C read from {hex(addr)}: {data.hex()}")
-        logger.debug(f"I2C read {nbytes} bytes from {hex(addr)}")
+        data = random.randbytes(nbytes)
+        if _VERBOSE:
+            print(f"📥 I2C read from {hex(addr)}: {data.hex()}")
+        logger.debug("I2C read %s bytes from %#x", nbytes, addr)
         return data
 
 
@@ -382,18 +456,20 @@ class SPI:
         self.miso = miso
 
         _simulation_state['spi_devices'][spi_id] = self
-        logger.debug(f"SPI {spi_id} initialized: baudrate={baudrate}")
+        logger.debug("SPI %s initialized: baudrate=%s", spi_id, baudrate)
 
     def write(self, buf: bytes):
         """Write to SPI."""
-        print(f"📤 SPI{self.spi_id} write: {buf.hex()}")
-        logger.debug(f"SPI wrote {len(buf)} bytes")
+        if _VERBOSE:
+            print(f"📤 SPI{self.spi_id} write: {buf.hex()}")
+        logger.debug("SPI wrote %s bytes", len(buf))
 
     def read(self, nbytes: int) -> bytes:
         """Read from SPI."""
-        data = bytes([random.randint(0, 255) for _ in range(nbytes)])
-        print(f"📥 SPI{self.spi_id} read: {data.hex()}")
-        logger.debug(f"SPI read {nbytes} bytes")
+        data = random.randbytes(nbytes)
+        if _VERBOSE:
+            print(f"📥 SPI{self.spi_id} read: {data.hex()}")
+        logger.debug("SPI read %s bytes", nbytes)
         return data
 
     def write_readinto(self, write_buf: bytes, read_buf: bytearray):
@@ -419,7 +495,8 @@ class machine:
     def freq(frequency: Optional[int] = None) -> int:
         """Get or set CPU frequency."""
         if frequency is not None:
-            print(f"🔧 CPU frequency set to {frequency} Hz")
+            if _VERBOSE:
+                print(f"🔧 CPU frequency set to {frequency} Hz")
             return frequency
         return 240000000  # Default ESP32 frequency
 
@@ -431,21 +508,23 @@ class machine:
     @staticmethod
     def reset():
         """Reset the device."""
-        print("🔄 Device reset (simulated)")
+        if _VERBOSE:
+            print("🔄 Device reset (simulated)")
         logger.info("Device reset requested")
 
     @staticmethod
     def soft_reset():
         """Soft reset the device."""
-        print("🔄 Soft reset (simulated)")
+        if _VERBOSE:
+            print("🔄 Soft reset (simulated)")
         logger.info("Soft reset requested")
 
 
 # Additional simulation utilities
 def simulate_button_press(pin_num: int, duration: float = 0.1):
     """Simulate a button press on the specified pin."""
-    if pin_num in _simulation_state['pins']:
-        pin_state = _simulation_state['pins'][pin_num]
+    pin_state = _pins.get(pin_num)
+    if pin_state is not None:
         if pin_state.mode == Pin.IN:
             # Simulate button press (pull low)
             old_value = pin_state.value
@@ -456,7 +535,8 @@ def simulate_button_press(pin_num: int, duration: float = 0.1):
             pin_obj = Pin(pin_num)
             pin_obj._check_irq_trigger(old_value, 0)
 
-            print(f"🔘 Button press simulated on GPIO{pin_num}")
+            if _VERBOSE:
+                print(f"🔘 Button press simulated on GPIO{pin_num}")
 
             # Schedule release
             def release_button():
@@ -464,34 +544,55 @@ def simulate_button_press(pin_num: int, duration: float = 0.1):
                 pin_state.value = 1 if pin_state.pull == Pin.PULL_UP else 0
                 pin_state.last_change = time.time()
                 pin_obj._check_irq_trigger(0, pin_state.value)
-                print(f"🔘 Button released on GPIO{pin_num}")
+                if _VERBOSE:
+                    print(f"🔘 Button released on GPIO{pin_num}")
 
             threading.Thread(target=release_button, daemon=True).start()
         else:
-            logger.warning(f"Pin {pin_num} is not configured as input")
+            logger.warning("Pin %s is not configured as input", pin_num)
     else:
-        logger.warning(f"Pin {pin_num} not initialized")
+        logger.warning("Pin %s not initialized", pin_num)
 
 
 def simulate_sensor_reading(pin_num: int, value: int):
     """Simulate a sensor reading on an analog pin."""
-    if pin_num in _simulation_state['pins']:
-        pin_state = _simulation_state['pins'][pin_num]
+    pin_state = _pins.get(pin_num)
+    if pin_state is not None:
         pin_state.value = value
-        print(f"📊 Sensor reading simulated on GPIO{pin_num}: {value}")
+        if _VERBOSE:
+            print(f"📊 Sensor reading simulated on GPIO{pin_num}: {value}")
+    else:
+        logger.warning("Pin %s not initialized", pin_num)
+
+
+def simulate_uart_input(uart_id: int, data: bytes):
+    """Simulate bytes arriving on a UART's RX line."""
+    uart = _simulation_state['uart_devices'].get(uart_id)
+    if uart is not None:
+        uart._buffer.extend(data)
     else:
-        logger.warning(f"Pin {pin_num} not initialized")
+        logger.warning("UART %s not initialized", uart_id)
+
+
+def _pin_snapshot(state: PinState) -> Dict[str, Any]:
+    return {
+        'mode': state.mode,
+        'value': state.value,
+        'pull': state.pull,
+        'last_change': state.last_change
+    }
+
+
+def get_pin_snapshot(pin_num: int) -> Optional[Dict[str, Any]]:
+    """Get the state of a single pin, or None if it was never initialized."""
+    state = _pins.get(pin_num)
+    return _pin_snapshot(state) if state is not None else None
 
 
 def get_simulation_state() -> Dict[str, Any]:
-    """Get current simulation state."""
+    """Get a snapshot of the whole simulation state."""
     return {
-        'pins': {num: {
-            'mode': state.mode,
-            'value': state.value,
-            'pull': state.pull,
-            'last_change': state.last_change
-        } for num, state in _simulation_state['pins'].items()},
+        'pins': {num: _pin_snapshot(state) for num, state in _pins.items()},
         'uptime': time.time() - _simulation_state['start_time'],
         'running': _simulation_state['running']
     }
@@ -499,26 +600,27 @@ def get_simulation_state() -> Dict[str, Any]:
 
 def print_simulation_status():
     """Print current simulation status."""
-    state = get_simulation_state()
+    # Reads the live pin states; printing needs no snapshot
+    pins = _pins
 
     print("\n" + "=" * 50)
     print("🔍 ESP32 SIMULATION STATUS")
     print("=" * 50)
-    print(f"⏱️  Uptime: {state['uptime']:.1f} seconds")
-    print(f"▶️  Running: {state['running']}")
-    print(f"📍 Active pins: {len(state['pins'])}")
+    print(f"⏱️  Uptime: {time.time() - _simulation_state['start_time']:.1f} seconds")
+    print(f"▶️  Running: {_simulation_state['running']}")
+    print(f"📍 Active pins: {len(pins)}")
 
-    if state['pins']:
+    if pins:
         print("\nPin States:")
-        for pin_num, pin_state in state['pins'].items():
-            mode = "OUT" if pin_state['mode'] == 1 else "IN"
+        for pin_num, pin_state in list(pins.items()):
+            mode = "OUT" if pin_state.mode == 1 else "IN"
             pull = ""
-            if pin_state['pull'] == 1:
+            if pin_state.pull == 1:
                 pull = " (PULL_UP)"
-            elif pin_state['pull'] == 2:
+            elif pin_state.pull == 2:
                 pull = " (PULL_DOWN)"
 
-            print(f"  GPIO{pin_num:2d}: {mode} = {pin_state['value']}{pull}")
+            print(f"  GPIO{pin_num:2d}: {mode} = {pin_state.value}{pull}")
 
     print("=" * 50)
 
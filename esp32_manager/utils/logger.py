@@ -1,8 +1,8 @@
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import sys
-from cgitb import handler
-from logging.handlers import RotatingFileHandler
 from typing import Optional
 
 
@@ -12,6 +12,7 @@ def setup_logging(
         *,
         max_bytes: int = 5_000_000,
         backup_count: int = 3,
+        console_buffer: int = 0,
 ):
     """
     Configure root logger:
@@ -20,6 +21,9 @@ def setup_logging(
       - Detailed formatter with module, function, line
       - Idempotent (won't re-configure if already set)
       - Clickable links in supported terminals
+      - Optional batching of console output: with ``console_buffer`` > 0,
+        records are held in memory and written in groups of that many
+        (errors and exit flush at once); the file handler stays unbuffered
     """
     root = logging.getLogger()
     if root.handlers:
@@ -59,7 +63,16 @@ def setup_logging(
         'formatter': 'detailed',
         'stream': 'ext://sys.stdout',
     }
-    root_handlers.append('console')
+    if console_buffer > 0:
+        handlers['memory'] = {
+            'class': 'logging.handlers.MemoryHandler',
+            'capacity': console_buffer,
+            'flushLevel': logging.ERROR,
+            'target': 'console',
+        }
+        root_handlers.append('memory')
+    else:
+        root_handlers.append('console')
 
     # File Handler
     if log_file:
@@ -87,6 +100,12 @@ def setup_logging(
     }
     logging.config.dictConfig(config)
 
+    if console_buffer > 0:
+        # Write out whatever is still buffered when the process exits
+        for handler in root.handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                atexit.register(handler.flush)
+
     # Hook uncaught exceptions into Logger
     def _handle_exception(exc_type, exc_value, exc_traceback):
         if issubclass(exc_type, KeyboardInterrupt):
@@ -94,4 +113,6 @@ def setup_logging(
             return
         root.error("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
 
-    sys.excepthook = _handle_exception
\ No newline at end of file
+    # Leave a hook installed by someone else (debugger, IDE) in place
+    if sys.excepthook is sys.__excepthook__:
+        sys.excepthook = _handle_exception
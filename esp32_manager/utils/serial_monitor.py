@@ -13,11 +13,10 @@ operate with any object that implements ``readline``.
 
 from __future__ import annotations
 
-from datetime import datetime
 import threading
 import time
 from pathlib import Path
-from typing import Callable, Optional, TextIO, TYPE_CHECKING
+from typing import BinaryIO, Callable, Optional, TYPE_CHECKING
 import logging
 
 if TYPE_CHECKING:  # pragma: no cover - used only for type hints
@@ -26,6 +25,12 @@ if TYPE_CHECKING:  # pragma: no cover - used only for type hints
 
 logger = logging.getLogger(__name__)
 
+# Longest time (seconds) a written line may sit in the log file's buffer
+LOG_FLUSH_INTERVAL = 0.5
+
+# pyserial read timeout (seconds) while monitoring; bounds how long stop() waits
+READ_TIMEOUT = 0.1
+
 
 class SerialMonitor:
     """Continuously read from a serial connection.
@@ -56,7 +61,11 @@ class SerialMonitor:
 
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self._log_handle: Optional[TextIO] = None
+        self._log_handle: Optional[BinaryIO] = None
+        self._saved_timeout: Optional[float] = None
+        self._blocking_reads = False
+        # Bytes read from a pyserial port that do not yet form a full line
+        self._pending = bytearray()
 
     # ------------------------------------------------------------------
     def start(self) -> None:
@@ -67,8 +76,11 @@ class SerialMonitor:
 
         if self.log_file_path:
             self.log_file_path.parent.mkdir(parents=True, exist_ok=True)
-            self._log_handle = self.log_file_path.open("a", encoding="utf-8")
+            # Binary: lines are logged as received, without a decode/encode round trip
+            self._log_handle = self.log_file_path.open("ab", buffering=65536)
 
+        self._blocking_reads = self._set_read_timeout()
+        self._pending.clear()
         self._stop_event.clear()
         self._thread = threading.Thread(target=self._read_loop, daemon=True)
         self._thread.start()
@@ -82,6 +94,10 @@ class SerialMonitor:
             self._thread.join(timeout=1)
             self._thread = None
 
+        if self._blocking_reads:
+            self._serial_port().timeout = self._saved_timeout
+            self._blocking_reads = False
+
         if self._log_handle:
             try:
                 self._log_handle.close()
@@ -90,43 +106,133 @@ class SerialMonitor:
             finally:
                 self._log_handle = None
 
+    # ------------------------------------------------------------------
+    def _serial_port(self):
+        """Return the underlying pyserial port, or None for other readers."""
+
+        # SerialConnection keeps its pyserial.Serial in ``connection``
+        port = getattr(self.connection, "connection", self.connection)
+        return port if hasattr(port, "in_waiting") else None
+
+    def _set_read_timeout(self) -> bool:
+        """Make readline() block briefly instead of polling with sleeps."""
+
+        port = self._serial_port()
+        if port is None:
+            return False
+        try:
+            self._saved_timeout = port.timeout
+            port.timeout = READ_TIMEOUT
+        except Exception:  # pragma: no cover - port without settable timeout
+            logger.debug("Could not set serial read timeout", exc_info=True)
+            return False
+        return True
+
+    def _read_lines(self) -> list[bytes]:
+        """Return the lines received so far, or an empty list when idle.
+
+        pyserial's ``readline`` issues one read per byte, so real ports are
+        read in chunks of whatever has arrived and split into lines here.
+        Other readers are simply asked for one ``readline`` at a time.
+        """
+
+        if not self._blocking_reads:
+            line = self.connection.readline()  # type: ignore[attr-defined]
+            return [line] if line else []
+
+        port = self._serial_port()
+        # Waits up to READ_TIMEOUT for the first byte, then takes the backlog
+        chunk = port.read(port.in_waiting or 1)
+        pending = self._pending
+        if not chunk:
+            if not pending:
+                return []
+            # Timed out mid-line: hand over the partial line, as readline() does
+            line = bytes(pending)
+            pending.clear()
+            return [line]
+
+        pending += chunk
+        end = pending.rfind(b"\n")
+        if end < 0:
+            return []
+        lines = pending[:end].split(b"\n")
+        del pending[:end + 1]
+        return lines
+
     # ------------------------------------------------------------------
     def _read_loop(self) -> None:
         """Background thread that reads and processes serial data."""
 
+        # Lines arriving within the same second share one formatted stamp
+        last_second = None
+        timestamp = ""
+        stamp_bytes = b""
+        # Log writes are buffered and flushed at most every LOG_FLUSH_INTERVAL
+        last_flush = time.monotonic()
+        unflushed = False
+
         while not self._stop_event.is_set():
             try:
-                line = self.connection.readline()  # type: ignore[attr-defined]
+                lines = self._read_lines()
             except Exception as exc:  # pragma: no cover - hardware errors
                 logger.error(f"Serial read failed: {exc}")
-                time.sleep(0.1)
+                self._stop_event.wait(0.1)
                 continue
 
-            if not line:
-                # Small sleep to prevent busy waiting when no data
-                time.sleep(0.05)
+            if not lines:
+                if unflushed:
+                    # Idle: nothing more to batch with, so write out now
+                    self._flush_log()
+                    unflushed = False
+                    last_flush = time.monotonic()
+                if not self._blocking_reads:
+                    # Short wait to prevent busy waiting; stop() ends it early
+                    self._stop_event.wait(0.05)
                 continue
 
-            try:
-                text = line.decode("utf-8", errors="ignore").rstrip()
-            except Exception:  # pragma: no cover - decoding errors
-                logger.debug("Failed to decode serial data", exc_info=True)
-                continue
+            for line in lines:
+                # Strip the raw bytes once; both the text and the log entry use them
+                line = line.rstrip()
+                try:
+                    text = line.decode("utf-8", errors="ignore")
+                except Exception:  # pragma: no cover - decoding errors
+                    logger.debug("Failed to decode serial data", exc_info=True)
+                    continue
+
+                second = int(time.time())
+                if second != last_second:
+                    last_second = second
+                    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+                    stamp_bytes = f"[{timestamp}] ".encode("ascii")
+                formatted = f"[{timestamp}] {text}"
 
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            formatted = f"[{timestamp}] {text}"
+                try:
+                    self.callback(formatted + "\n")
+                except Exception:  # pragma: no cover - callback safety
+                    logger.debug("Serial monitor callback failed", exc_info=True)
+
+                if self._log_handle:
+                    try:
+                        self._log_handle.write(stamp_bytes + line + b"\n")
+                        unflushed = True
+                    except Exception:  # pragma: no cover - disk errors
+                        logger.debug("Failed to write serial log", exc_info=True)
+
+                    now = time.monotonic()
+                    if now - last_flush >= LOG_FLUSH_INTERVAL:
+                        self._flush_log()
+                        unflushed = False
+                        last_flush = now
 
-            try:
-                self.callback(formatted + "\n")
-            except Exception:  # pragma: no cover - callback safety
-                logger.debug("Serial monitor callback failed", exc_info=True)
+    # ------------------------------------------------------------------
+    def _flush_log(self) -> None:
+        """Flush buffered log lines to disk."""
 
-            if self._log_handle:
-                try:
-                    self._log_handle.write(formatted + "\n")
-                    self._log_handle.flush()
-                except Exception:  # pragma: no cover - disk errors
-                    logger.debug("Failed to write serial log", exc_info=True)
+        try:
+            self._log_handle.flush()  # type: ignore[union-attr]
+        except Exception:  # pragma: no cover - disk errors
+            logger.debug("Failed to flush serial log", exc_info=True)
 
 
 __all__ = ["SerialMonitor"]
\ No newline at end of file
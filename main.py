@@ -2,17 +2,16 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-
-from app import ESP32ManagerApp
-from esp32_manager.utils.logger import setup_logging
+from typing import List, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command-line argument parser."""
-    parser = argparse.ArgumentParser(
-        description="ESP32 Project Manager - Development Suite",
-        epilog="""
+# Argument choices and help text, built once at import
+TEMPLATE_CHOICES = ('basic', 'iot', 'sensors', 'webserver')
+FEATURE_CHOICES = ('mqtt', 'web_server', 'data_logging')
+INTERFACE_CHOICES = ('cli', 'tui')
+
+EPILOG = """
 Examples:
     %(prog)s init                           # Initialize workspace
     %(prog)s create my_project              # Create new project
@@ -20,7 +19,99 @@ Examples:
     %(prog)s interactive                    # Interactive CLI mode
     %(prog)s interactive --interface tui    # Terminal UI mode
     %(prog)s web                            # Web interface
-        """,
+        """
+
+def _add_create_args(p: argparse.ArgumentParser):
+    p.add_argument('name', help='Project name')
+    p.add_argument('--description', help='Project description')
+    p.add_argument('--template', choices=TEMPLATE_CHOICES,
+                   help='Project template')
+    p.add_argument('--author', '-a', default='', help='Project author name')
+    p.add_argument('--without', action='append', default=[],
+                   choices=FEATURE_CHOICES,
+                   help='Leave an optional feature out of the generated code (repeatable)')
+
+def _add_list_args(p: argparse.ArgumentParser):
+    p.add_argument('--filter', '-f', help='Filter by tag')
+
+def _add_name_arg(p: argparse.ArgumentParser):
+    p.add_argument('name', help='Project name')
+
+def _add_optional_name_arg(p: argparse.ArgumentParser):
+    p.add_argument('name', nargs='?', help='Project name (current if not specified)')
+
+def _add_build_args(p: argparse.ArgumentParser):
+    _add_optional_name_arg(p)
+    p.add_argument('--precompile', action='store_true',
+                   help='Compile modules to .mpy bytecode with mpy-cross')
+
+def _add_deploy_args(p: argparse.ArgumentParser):
+    _add_optional_name_arg(p)
+    p.add_argument('--device', '-d', default='/dev/ttyUSB0', help='Target device')
+    p.add_argument('--precompile', action='store_true',
+                   help='Compile modules to .mpy bytecode with mpy-cross')
+
+def _add_delete_args(p: argparse.ArgumentParser):
+    _add_name_arg(p)
+    p.add_argument('--remove-files', action='store_true', help='Remove project files')
+
+def _add_export_args(p: argparse.ArgumentParser):
+    _add_name_arg(p)
+    p.add_argument('--output', '-o', help='Output path')
+
+def _add_stats_args(p: argparse.ArgumentParser):
+    p.add_argument('--workspace', '-w', type=Path,
+                   help='Workspace directory (default: current directory)')
+
+def _add_search_args(p: argparse.ArgumentParser):
+    p.add_argument('query', help='Search query')
+
+def _add_interactive_args(p: argparse.ArgumentParser):
+    p.add_argument('--interface', '-i', choices=INTERFACE_CHOICES,
+                   default='cli', help='Interface type')
+
+def _add_web_args(p: argparse.ArgumentParser):
+    p.add_argument('--host', default='127.0.0.1', help='Host address')
+    p.add_argument('--port', '-p', type=int, default=8000, help='Port number')
+
+# Subcommands: name -> (help, function adding the command's arguments)
+COMMANDS = {
+    # Workspace
+    'init': ('Initialize workspace in current directory', None),
+    # Project management
+    'create': ('Create new project', _add_create_args),
+    'list': ('List all projects', _add_list_args),
+    'current': ('Set current project', _add_name_arg),
+    'info': ('Show project information', _add_optional_name_arg),
+    # Development
+    'simulate': ('Simulate project locally', _add_optional_name_arg),
+    'build': ('Build project', _add_build_args),
+    'deploy': ('Deploy project to ESP32', _add_deploy_args),
+    'test': ('Run tests for project', _add_optional_name_arg),
+    # Utilities
+    'delete': ('Delete project', _add_delete_args),
+    'export': ('Export project as archive', _add_export_args),
+    'stats': ('Show workspace statistics', _add_stats_args),
+    'search': ('Search projects', _add_search_args),
+    'interactive': ('Start interactive mode', _add_interactive_args),
+    # Web interface
+    'web': ('Start web interface', _add_web_args),
+}
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """Create command-line argument parser.
+
+    Every subcommand is registered so top-level help lists them all, but
+    only the commands named in ``argv`` (default ``sys.argv[1:]``) get
+    their arguments added; the others are never parsed.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    used = set(argv)
+
+    parser = argparse.ArgumentParser(
+        description="ESP32 Project Manager - Development Suite",
+        epilog=EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
@@ -32,68 +123,10 @@ Examples:
     parser.add_argument('--log-file', help='Log file path')
 
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Initialize workspace
-    subparsers.add_parser('init', help='Initialize workspace in current directory')
-
-    # Project management commands
-    create_cmd_parser = subparsers.add_parser('create', help='Create new project')
-    create_cmd_parser.add_argument('name', help='Project name')
-    create_cmd_parser.add_argument('--description', help='Project description')
-    create_cmd_parser.add_argument('--template', choices=['basic', 'iot', 'sensors', 'webserver'],
-                                   help='Project template')
-    create_cmd_parser.add_argument('--author', '-a', default='', help='Project author name')
-
-    # List projects
-    list_parser = subparsers.add_parser('list', help='List all projects')
-    list_parser.add_argument('--filter', '-f', help='Filter by tag')
-
-    # Set current project
-    current_parser = subparsers.add_parser('current', help='Set current project')
-    current_parser.add_argument('name', help='Project name')
-
-    # Project info
-    info_parser = subparsers.add_parser('info', help='Show project information')
-    info_parser.add_argument('name', nargs='?', help='Project name (current if not specified)')
-
-    # Development commands
-    sim_parser = subparsers.add_parser('simulate', help='Simulate project locally')
-    sim_parser.add_argument('name', nargs='?', help='Project name (current if not specified)')
-
-    build_parser = subparsers.add_parser('build', help='Build project')
-    build_parser.add_argument('name', nargs='?', help='Project name (current if not specified)')
-
-    deploy_parser = subparsers.add_parser('deploy', help='Deploy project to ESP32')
-    deploy_parser.add_argument('name', nargs='?', help='Project name (current if not specified)')
-    deploy_parser.add_argument('--device', '-d', default='/dev/ttyUSB0', help='Target device')
-
-    test_parser = subparsers.add_parser('test', help='Run tests for project')
-    test_parser.add_argument('name', nargs='?', help='Project name (current if not specified)')
-
-    # Utility commands
-    delete_parser = subparsers.add_parser('delete', help='Delete project')
-    delete_parser.add_argument('name', help='Project name')
-    delete_parser.add_argument('--remove-files', action='store_true', help='Remove project files')
-
-    export_parser = subparsers.add_parser('export', help='Export project as archive')
-    export_parser.add_argument('name', help='Project name')
-    export_parser.add_argument('--output', '-o', help='Output path')
-
-    stats_parser = subparsers.add_parser('stats', help='Show workspace statistics')
-    stats_parser.add_argument('--workspace', '-w', type=Path,
-                        help='Workspace directory (default: current directory)')
-
-    search_parser = subparsers.add_parser('search', help='Search projects')
-    search_parser.add_argument('query', help='Search query')
-
-    interactive_parser = subparsers.add_parser('interactive', help='Start interactive mode')
-    interactive_parser.add_argument('--interface', '-i', choices=['cli', 'tui'],
-                                    default='cli', help='Interface type')
-
-    # Web interface
-    web_parser = subparsers.add_parser('web', help='Start web interface')
-    web_parser.add_argument('--host', default='127.0.0.1', help='Host address')
-    web_parser.add_argument('--port', '-p', type=int, default=8000, help='Port number')
+    for name, (help_text, add_args) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if add_args and name in used:
+            add_args(command_parser)
 
     return parser
 
@@ -102,6 +135,11 @@ def main():
     parser = create_parser()
     args = parser.parse_args()
 
+    # Imported only once arguments are valid, so --help and usage errors
+    # return without loading the application and its device/build stack
+    from app import ESP32ManagerApp
+    from esp32_manager.utils.logger import setup_logging
+
     # Set up logging
     log_level = "DEBUG" if args.verbose else "INFO"
     setup_logging(log_level, args.log_file)
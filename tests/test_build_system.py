@@ -29,4 +29,21 @@ def test_build_creates_metadata(tmp_path):
     metadata_path = build_system.build_dir / 'proj' / 'build_metadata.json'
     assert metadata_path.exists()
     data = json.loads(metadata_path.read_text())
-    assert data['project']['name'] == 'proj'
\ No newline at end of file
+    assert data['project']['name'] == 'proj'
+
+
+def test_cross_compile_replaces_modules_but_keeps_entry_scripts(tmp_path, monkeypatch):
+    build_dir = tmp_path / 'build'
+    build_dir.mkdir()
+    (build_dir / 'main.py').write_text('import utils')
+    (build_dir / 'utils.py').write_text('X = 1')
+
+    def fake_mpy_cross(cmd, check):
+        Path(cmd[cmd.index('-o') + 1]).write_bytes(b'M')
+
+    monkeypatch.setattr('shutil.which', lambda name: name)
+    monkeypatch.setattr('subprocess.run', fake_mpy_cross)
+
+    BuildSystem._cross_compile_project(build_dir, BuildConfig())
+
+    assert sorted(p.name for p in build_dir.iterdir()) == ['main.py', 'utils.mpy']
@@ -15,4 +15,65 @@ def test_analyze_project_detects_issues(tmp_path: Path) -> None:
     warnings = analyze_project(tmp_path)
     assert any("Forbidden import 'subprocess'" in w for w in warnings)
     assert any("Line too long" in w for w in warnings)
-    assert all("good.py" not in w for w in warnings)
\ No newline at end of file
+    assert all("good.py" not in w for w in warnings)
+
+def test_analyze_project_reports_each_import_once(tmp_path: Path) -> None:
+    (tmp_path / "app.py").write_text("import threading\nx = 1\ny = 2\n")
+
+    warnings = analyze_project(tmp_path)
+    assert len([w for w in warnings if "Forbidden import 'threading'" in w]) == 1
+
+
+def test_analyze_project_finds_nested_imports(tmp_path: Path) -> None:
+    (tmp_path / "app.py").write_text(
+        "def run():\n"
+        "    try:\n"
+        "        from multiprocessing import Pool\n"
+        "    except ImportError:\n"
+        "        import threading\n"
+    )
+
+    warnings = analyze_project(tmp_path)
+    assert any("app.py:3 Forbidden import 'multiprocessing'" in w for w in warnings)
+    assert any("app.py:5 Forbidden import 'threading'" in w for w in warnings)
+
+
+def test_analyze_project_skips_excluded_dirs(tmp_path: Path) -> None:
+    venv = tmp_path / "venv" / "lib"
+    venv.mkdir(parents=True)
+    (venv / "vendored.py").write_text("import subprocess\n")
+
+    assert analyze_project(tmp_path) == []
+
+
+def test_analyze_project_in_parallel(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("esp32_manager.utils.code_analyzer.PARALLEL_MIN_FILES", 1)
+    for i in range(3):
+        (tmp_path / f"mod{i}.py").write_text("import asyncio\n")
+
+    warnings = analyze_project(tmp_path)
+    assert sorted(Path(w.split(":")[0]).name for w in warnings) == ["mod0.py", "mod1.py", "mod2.py"]
+
+
+def test_analyze_project_reuses_cached_results(tmp_path: Path, monkeypatch) -> None:
+    from esp32_manager.utils import code_analyzer
+
+    project = tmp_path / "proj"
+    project.mkdir()
+    (project / "app.py").write_text("import threading\n")
+    cache_file = tmp_path / "cache" / "analyzer.json"
+
+    first = analyze_project(project, cache_file=cache_file)
+    assert cache_file.exists()
+
+    def fail(path):
+        raise AssertionError(f"{path} should have come from the cache")
+
+    monkeypatch.setattr(code_analyzer, "_analyze_file", fail)
+    assert analyze_project(project, cache_file=cache_file) == first
+
+
+def test_analyze_project_counts_characters_not_bytes(tmp_path: Path) -> None:
+    (tmp_path / "text.py").write_text(f"s = '{'é' * 80}'\n", encoding="utf-8")
+
+    assert analyze_project(tmp_path) == []
@@ -0,0 +1,51 @@
+import time
+
+from esp32_manager.utils.hardware_stubs import (
+    Pin,
+    Timer,
+    UART,
+    get_pin_snapshot,
+    simulate_uart_input,
+)
+
+
+def test_uart_readline_consumes_buffer():
+    uart = UART(7)
+    simulate_uart_input(7, b"one\ntwo")
+
+    assert uart.readline() == b"one\n"
+    assert uart.readline() is None
+    assert uart.read() == b"two"
+    assert uart.any() == 0
+
+
+def test_timers_share_scheduler_and_stop_cleanly():
+    fired = {"periodic": 0, "one_shot": 0}
+
+    periodic = Timer(10)
+    periodic.init(Timer.PERIODIC, 10, lambda t: fired.__setitem__("periodic", fired["periodic"] + 1))
+    one_shot = Timer(11)
+    one_shot.init(Timer.ONE_SHOT, 10, lambda t: fired.__setitem__("one_shot", fired["one_shot"] + 1))
+
+    periodic.start()
+    one_shot.start()
+    time.sleep(0.1)
+    periodic.stop()
+    count = fired["periodic"]
+    time.sleep(0.05)
+
+    assert count >= 3
+    assert fired["periodic"] == count
+    assert fired["one_shot"] == 1
+
+
+def test_get_pin_snapshot_copies_single_pin():
+    pin = Pin(21, Pin.OUT)
+    pin.value(1)
+
+    snapshot = get_pin_snapshot(21)
+    pin.value(0)
+
+    assert snapshot["mode"] == Pin.OUT
+    assert snapshot["value"] == 1
+    assert get_pin_snapshot(99) is None
@@ -1,5 +1,6 @@
 import json
-import shutil
+import os
+import zipfile
 from pathlib import Path
 import sys
 
@@ -27,7 +28,10 @@ def create_zip_with_project(tmp_path: Path, with_config: bool = True):
     (source / 'dummy.txt').write_text('hello', encoding='utf-8')
 
     archive = tmp_path / 'archive.zip'
-    shutil.make_archive(str(archive.with_suffix('')), 'zip', source)
+    # Stored, not deflated: the fixture only needs a valid archive
+    with zipfile.ZipFile(archive, 'w', compression=zipfile.ZIP_STORED) as zf:
+        for entry in os.scandir(source):
+            zf.write(entry.path, entry.name)
     return archive
 
 
@@ -79,4 +83,16 @@ def test_create_project_creates_structure(tmp_path):
     project_path = tmp_path / 'demo'
     assert project_path.exists()
     assert (project_path / 'src' / 'main.py').exists()
-    assert manager.projects['demo'].name == 'demo'
\ No newline at end of file
+    assert manager.projects['demo'].name == 'demo'
+
+def test_failed_save_leaves_no_temp_file(tmp_path, monkeypatch):
+    manager = ProjectManager(tmp_path)
+    assert manager.save_projects()
+
+    def fail_replace(src, dst):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(os, 'replace', fail_replace)
+    assert not manager.save_projects()
+    assert not list(manager.config_file.parent.glob('*.tmp'))
+    assert manager.config_file.exists()
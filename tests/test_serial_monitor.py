@@ -1,3 +1,4 @@
+import threading
 import time
 from pathlib import Path
 
@@ -15,39 +16,87 @@ class DummyConnection:
         time.sleep(0.05)
         return b''
 
-def _wait_for(condition, timeout: float  = 1.0):
-    start = time.time()
-    while time.time() - start < timeout:
-        if condition():
-            return True
-        time.sleep(0.05)
-    return False
+class Collector:
+    """Monitor callback that records lines and wakes waiters on arrival."""
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self._cond = threading.Condition()
+
+    def __call__(self, line: str) -> None:
+        with self._cond:
+            self.lines.append(line)
+            self._cond.notify_all()
+
+    def wait_for(self, count: int, timeout: float = 1.0) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: len(self.lines) >= count, timeout)
 
 def test_serial_monitor_reads_lines_and_calls_callback(tmp_path: Path):
     lines = [b"hello\n", b"world\n"]
-    collected: list[str] = []
-    monitor = SerialMonitor(DummyConnection(lines.copy()), callback=collected.append)
+    collected = Collector()
+    monitor = SerialMonitor(DummyConnection(lines.copy()), callback=collected)
 
     monitor.start()
-    _wait_for(lambda: len(collected) >= 2)
+    collected.wait_for(2)
     monitor.stop()
 
-    assert any("hello" in line for line in collected)
-    assert any('world' in line for line in collected)
+    assert any("hello" in line for line in collected.lines)
+    assert any('world' in line for line in collected.lines)
 
 def test_serial_monitor_writes_to_log(tmp_path: Path):
     lines = [b"log line\n"]
-    collected: list[str] = []
+    collected = Collector()
     log_file = tmp_path / "logs" / "serial.log"
 
     monitor = SerialMonitor(
-        DummyConnection(lines.copy()), callback=collected.append, log_file=log_file
+        DummyConnection(lines.copy()), callback=collected, log_file=log_file
     )
 
     monitor.start()
-    _wait_for(lambda: collected)
+    collected.wait_for(1)
     monitor.stop()
 
     assert log_file.exists()
     assert "log line" in log_file.read_text()
-    assert monitor._log_handle is None
\ No newline at end of file
+    assert monitor._log_handle is None
+
+class DummyPort:
+    """Stand-in for a pyserial port, whose reads block up to ``timeout``."""
+
+    def __init__(self, chunks: list[bytes] | None = None):
+        self.timeout = 5.0
+        self.chunks = chunks or []
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self.chunks[0]) if self.chunks else 0
+
+    def read(self, size: int = 1) -> bytes:  # pragma: no cover - exercised via thread
+        if self.chunks:
+            return self.chunks.pop(0)
+        time.sleep(self.timeout)
+        return b''
+
+def test_serial_monitor_shortens_and_restores_port_timeout():
+    port = DummyPort()
+    monitor = SerialMonitor(port)
+
+    monitor.start()
+    assert port.timeout == 0.1
+    monitor.stop()
+
+    assert port.timeout == 5.0
+
+def test_serial_monitor_splits_port_chunks_into_lines():
+    port = DummyPort([b"hel", b"lo\r\nwor", b"ld\n\npart"])
+    collected = Collector()
+    monitor = SerialMonitor(port, callback=collected)
+
+    monitor.start()
+    collected.wait_for(4)
+    monitor.stop()
+
+    assert [line.split("] ", 1)[1] for line in collected.lines] == [
+        "hello\n", "world\n", "\n", "part\n"
+    ]
@@ -1,4 +1,9 @@
-from esp32_manager.templates import get_template_files
+import subprocess
+import sys
+
+import pytest
+
+from esp32_manager.templates import get_template_files, write_project_files
 from esp32_manager.core.config_manager import ProjectConfig
 
 
@@ -6,4 +11,80 @@ def test_basic_template_files(tmp_path):
     config = ProjectConfig(name='demo', path=tmp_path)
     files = get_template_files('basic', config)
     assert 'src/main.py' in files
-    assert 'README.md' in files
\ No newline at end of file
+    assert 'README.md' in files
+
+
+def test_write_project_files_creates_nested_files(tmp_path):
+    config = ProjectConfig(name='demo', path=tmp_path)
+    files = get_template_files('basic', config)
+    write_project_files(files, tmp_path)
+    for rel_path, content in files.items():
+        assert (tmp_path / rel_path).read_text(encoding='utf-8') == content
+
+
+def test_basic_pin_caps_match_pinout(tmp_path):
+    config = ProjectConfig(name='demo', path=tmp_path)
+    files = get_template_files('basic', config)
+    namespace = {}
+    exec(files['src/pin_caps.py'], namespace)
+    has_cap = namespace['has_cap']
+    assert [pin for pin in range(40) if has_cap(pin, namespace['IN_ONLY'])] == [34, 35, 36, 39]
+    assert [pin for pin in range(40) if has_cap(pin, namespace['BOOTSTRAP'])] == [0, 2, 12, 15]
+    assert [pin for pin in range(40) if has_cap(pin, namespace['FLASH'])] == list(range(6, 12))
+    assert not namespace['is_output_capable'](34)
+
+
+def test_iot_main_drops_disabled_feature_sections(tmp_path):
+    from esp32_manager.templates.iot import IoTTemplate, _select_sections
+
+    config = ProjectConfig(name='demo', path=tmp_path)
+    config.build_config['disabled_features'] = ['mqtt', 'web_server']
+    disabled = IoTTemplate(config).disabled_features()
+    assert disabled == {'mqtt', 'web_server'}
+
+    main = _select_sections(IoTTemplate._generate_main(), disabled)
+    assert 'MQTTClient' not in main and 'mqtt_rx_task' not in main
+    assert '# [' not in main
+    compile(main, 'main.py', 'exec')
+
+
+def test_write_project_files_writes_bytes_verbatim(tmp_path):
+    write_project_files({'assets/web/index.html.gz': b'\x1f\x8b\x00'}, tmp_path)
+    assert (tmp_path / 'assets/web/index.html.gz').read_bytes() == b'\x1f\x8b\x00'
+
+
+@pytest.mark.parametrize('disabled', [['web_server'], ['data_logging'], ['mqtt', 'web_server', 'data_logging']])
+def test_create_iot_project_end_to_end(tmp_path, disabled):
+    from esp32_manager.core.project_manager import ProjectManager
+
+    manager = ProjectManager(tmp_path)
+    manager.create_project('demo', template='iot', disabled_features=disabled)
+
+    project = tmp_path / 'demo'
+    src = project / 'src'
+    assert (src / 'utils.py').exists()
+    assert (src / 'web_server.py').exists() == ('web_server' not in disabled)
+    assert (src / 'data_logger.py').exists() == ('data_logging' not in disabled)
+    for name in ('index.html', 'index.html.gz'):
+        assert (project / 'assets' / 'web' / name).exists() == ('web_server' not in disabled)
+    for name in ('main.py', 'utils.py', 'config.py'):
+        compile((src / name).read_text(encoding='utf-8'), name, 'exec')
+    assert 'demo' in (project / 'docs' / 'API.md').read_text(encoding='utf-8')
+
+    # The generated project's own tests must run against what was emitted
+    result = subprocess.run(
+        [sys.executable, '-m', 'unittest', 'discover', '-s', 'tests', '-p', 'test_*.py'],
+        cwd=project, capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_iot_web_assets_ship_gzipped_copies(tmp_path):
+    import gzip
+
+    config = ProjectConfig(name='demo', path=tmp_path)
+    files = get_template_files('iot', config)
+    for name in ('index.html', 'styles.css', 'scripts.js'):
+        path = f'assets/web/{name}'
+        assert files[path]
+        assert gzip.decompress(files[path + '.gz']).decode('utf-8') == files[path]
@@ -104,6 +104,12 @@ class ESP32Manager {
                 throw new Error(error.detail || `HTTP ${response.status}`);
             }
 
+            // Large files are streamed back as plain text
+            const contentType = response.headers.get('content-type') || '';
+            if (!contentType.includes('application/json')) {
+                return await response.text();
+            }
+
             return await response.json();
         } catch (error) {
             this.showNotification('Error: ' + error.message, 'error');
@@ -198,7 +204,7 @@ class ESP32Manager {
         try {
             const data = await this.apiCall(`/api/projects/${projectName}/files/${filePath}`);
             this.openFiles.set(filePath, {
-                content: data.content,
+                content: typeof data === 'string' ? data : data.content,
                 modified: false,
                 path: filePath,
                 project: projectName